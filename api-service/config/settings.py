@@ -1,4 +1,6 @@
-COLLECTIONS = {
+# Immutable so hot-path membership checks stay a single hash probe and
+# no handler can mutate the collection list at runtime.
+COLLECTIONS = frozenset({
     "PierSight_V01", 
     "PierSight_V02", 
     "PierSight_V03", 
@@ -31,8 +33,25 @@ COLLECTIONS = {
     "PierSight_V30", 
     "PierSight_V31", 
     "PierSight_V32"
-}
+})
 
 LIMIT = 7
 OFFSET = 0
 
+# Single Redis instance shared by the response cache and the rate
+# limiter, so counters stay correct across uvicorn workers.
+REDIS_URL = "redis://127.0.0.1:6379"
+
+# Per-endpoint cache TTL classes (seconds). Listings go stale as new
+# scenes land, so they take the normal class; collection metadata is
+# near-static and takes the long class.
+CACHE_TTL_NORMAL = 3600
+CACHE_TTL_LONG = 86400
+
+# Connection pool sizing for the shared async engine. Sized for uvicorn
+# worker concurrency; keep pool_recycle below the server idle timeout.
+DB_POOL_SIZE = 20
+DB_MAX_OVERFLOW = 40
+DB_POOL_TIMEOUT = 10
+DB_POOL_RECYCLE = 1800
+
@@ -9,6 +9,7 @@ from sqlalchemy.orm import sessionmaker
 
 # Local Imports
 from dotenv import load_dotenv
+from config.settings import DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE
 
 load_dotenv()
 
@@ -20,10 +21,23 @@ DB_HOST = os.getenv('DB_HOST')
 DB_PORT = os.getenv('DB_PORT')
 
 
-DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:Niral07123@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# prepared_statement_cache_size keeps one cached asyncpg plan per
+# canonical query variant on every pooled connection, so the handlers'
+# module-level statements skip parse/plan after first use.
+DATABASE_URL = (
+    f"postgresql+asyncpg://{DB_USER}:Niral07123@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    "?prepared_statement_cache_size=500"
+)
 
 
-engine = create_async_engine(DATABASE_URL)
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_timeout=DB_POOL_TIMEOUT,
+)
 AsyncSessionLocal = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
 Base = declarative_base()
 
@@ -1,30 +1,93 @@
 # Imports
-import time
-
 # Third-Party Imports
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
 import redis.asyncio as redis
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.httpsredirect import HTTPSRedirectMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 from contextlib import asynccontextmanager
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
+from sqlalchemy.sql import text as sql_text
 
 # Local Imports
 from database.postgre import engine
 from models import log_entry as log_model
 from models import collection as collection_model
-from schemas import catalog
 from middlewares.jwt_auth_middleware import JWTAuthMiddleware
 from middlewares.logg_middleware import LoggMiddleware
+from middlewares.rate_limit_middleware import RateLimitMiddleware
+from utils import ORJsonCoder
+from config.settings import REDIS_URL
 from routers import catalog, collections, search, items
 
 
-duckdb_conn = None
+# Spatial indexing for the bbox filters, applied idempotently at startup.
+# Both stac tables get a GENERATED ALWAYS geometry column backed by
+# GiST, so new ingests materialize their geometry once at write time and
+# the && bbox operator prunes candidates without decoding hex WKB per
+# row. The DO blocks upgrade a pre-existing plain column in place
+# without rebuilding it on every boot.
+_STAC_SPATIAL_DDL = (
+    # One guarded block per table: the ingest pipeline owns the stac
+    # tables and they are not part of this service's metadata, so on a
+    # fresh database to_regclass() returns NULL and the block exits
+    # quietly instead of raising like a ::regclass cast would.
+    # The composite B-trees back the satellite-equality + time-range
+    # filter and the DESC index-ordered pagination; id DESC matches the
+    # total ORDER BY the keyset cursor seeks on (the dropped
+    # *_sat_time_idx predecessors lacked it). stac_sat_product_idx
+    # turns the single-item (satellite_name, product_name) probe into
+    # one index descent.
+    """
+    DO $$
+    BEGIN
+        IF to_regclass('piersight_stac.stac') IS NULL THEN
+            RETURN;
+        END IF;
+        DROP INDEX IF EXISTS piersight_stac.ix_stac_bounding_box_gist;
+        DROP INDEX IF EXISTS piersight_stac.stac_sat_time_idx;
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_attribute
+            WHERE attrelid = to_regclass('piersight_stac.stac')
+              AND attname = 'bbox_geom' AND attgenerated = 's'
+        ) THEN
+            ALTER TABLE piersight_stac.stac DROP COLUMN IF EXISTS bbox_geom;
+            ALTER TABLE piersight_stac.stac ADD COLUMN bbox_geom geometry(Geometry, 4326)
+                GENERATED ALWAYS AS (ST_GeomFromWKB(decode(bounding_box_wkb, 'hex'), 4326)) STORED;
+        END IF;
+        CREATE INDEX IF NOT EXISTS stac_bbox_gix
+            ON piersight_stac.stac USING GIST (bbox_geom);
+        CREATE INDEX IF NOT EXISTS stac_sat_time_id_idx
+            ON piersight_stac.stac (satellite_name, acquisition_start_utc DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS stac_sat_product_idx
+            ON piersight_stac.stac (satellite_name, product_name);
+    END $$
+    """,
+    """
+    DO $$
+    BEGIN
+        IF to_regclass('stac_metadata.stac') IS NULL THEN
+            RETURN;
+        END IF;
+        DROP INDEX IF EXISTS stac_metadata.stac_metadata_sat_time_idx;
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_attribute
+            WHERE attrelid = to_regclass('stac_metadata.stac')
+              AND attname = 'geom' AND attgenerated = 's'
+        ) THEN
+            ALTER TABLE stac_metadata.stac DROP COLUMN IF EXISTS geom;
+            ALTER TABLE stac_metadata.stac ADD COLUMN geom geometry(Geometry, 4326)
+                GENERATED ALWAYS AS (ST_GeomFromWKB(decode(bounding_box_wkb, 'hex'), 4326)) STORED;
+        END IF;
+        CREATE INDEX IF NOT EXISTS stac_geom_gix
+            ON stac_metadata.stac USING GIST (geom);
+        CREATE INDEX IF NOT EXISTS stac_metadata_sat_time_id_idx
+            ON stac_metadata.stac (satellite_name, acquisition_start_utc DESC, id DESC);
+    END $$
+    """,
+)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -39,11 +102,20 @@ async def lifespan(app: FastAPI):
     Returns:
         None. Used as a context manager for FastAPI lifespan events.
     '''
-    redis_client = redis.from_url("redis://127.0.0.1:6379", encoding="utf8", decode_responses=True)
-    FastAPICache.init(RedisBackend(redis_client), prefix="fastapi-cache")
+    redis_client = redis.from_url(
+        REDIS_URL,
+        encoding="utf8",
+        decode_responses=True,
+        max_connections=50,
+        socket_keepalive=True,
+        retry_on_timeout=True,
+    )
+    FastAPICache.init(RedisBackend(redis_client), prefix="fastapi-cache", coder=ORJsonCoder)
     async with engine.begin() as conn:
         await conn.run_sync(log_model.Base.metadata.create_all)
         await conn.run_sync(collection_model.Base.metadata.create_all)
+        for ddl in _STAC_SPATIAL_DDL:
+            await conn.execute(sql_text(ddl))
         print("🏪Database is ready")
     yield
     await engine.dispose()
@@ -70,6 +142,7 @@ tags_metadata = [
 
 app = FastAPI(
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     title='STAC APIs',
     description='''
     STAC APIs for PierSight Space Maritime Servilliance Data
@@ -109,25 +182,14 @@ app = FastAPI(
     }    
 )
 
-limiter = Limiter(key_func=get_remote_address, headers_enabled=True)
-
-
 ############################################################################################################
 # Middlewares
 ############################################################################################################
 # app.add_middleware(HTTPSRedirectMiddleware)
 # app.add_middleware(TrustedHostMiddleware, allowed_hosts=["13.233.148.94", "localhost", "127.0.0.1", "49.36.67.172"])   # stac.eodata.piersight.space - Hostname for production
-print("1")
 # app.add_middleware(JWTAuthMiddleware)
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, lambda request, exc: JSONResponse(
-    status_code=429,
-    content={
-        "detail": "Rate limit exceeded. Try again later.",
-        "type": "RateLimitExceeded",
-        "retry_after": getattr(exc, "retry_after", None)
-    }
-))
+app.add_middleware(RateLimitMiddleware)
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
 # app.add_middleware(LoggMiddleware)
   
 ############################################################################################################
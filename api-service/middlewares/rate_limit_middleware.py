@@ -0,0 +1,186 @@
+# Imports
+# Standard Library Imports
+import time
+from collections import deque
+from itertools import count
+
+# Third-Party Imports
+import orjson
+import redis.asyncio as redis
+
+# Local Imports
+from config.settings import REDIS_URL
+
+
+# Default limit matches the documented "5 requests per minute" policy.
+RATE_LIMIT = 5
+WINDOW_SECONDS = 60
+
+# AIMD admission-control bounds: the concurrency gate grows additively
+# while responses stay healthy and halves on server errors, shedding
+# load with fast 503s instead of queueing requests into timeouts.
+MIN_CONCURRENCY = 4
+MAX_CONCURRENCY = 256
+ADDITIVE_INCREASE = 0.5
+MULTIPLICATIVE_DECREASE = 0.5
+
+# Per-process sliding windows used when Redis is unreachable, keyed by
+# "<client_ip>:<path>" -> deque of request timestamps.
+_FALLBACK_WINDOWS = {}
+
+
+def reset_fallback_windows():
+    """
+    Clears the in-process fallback counters.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    _FALLBACK_WINDOWS.clear()
+
+
+############################################################################################################
+# Rate Limiting Middleware Definition
+############################################################################################################
+class RateLimitMiddleware:
+    """
+    Pure-ASGI sliding-window rate limiter with AIMD admission control.
+
+    Counts requests in a Redis sorted set per client and path, so the
+    window slides smoothly instead of resetting on fixed boundaries and
+    stays accurate across uvicorn workers. Falls back to per-process
+    windows when Redis is unavailable. An AIMD-controlled concurrency
+    gate sheds load with a 503 once in-flight requests exceed the
+    current limit, which halves on 5xx responses and recovers additively.
+
+    Args:
+        app: The downstream ASGI application.
+        limit: Allowed requests per client per path per window.
+        window_seconds: Length of the sliding window in seconds.
+        redis_url: Redis instance that holds the shared counters.
+    """
+
+    def __init__(self, app, limit=RATE_LIMIT, window_seconds=WINDOW_SECONDS, redis_url=REDIS_URL):
+        self.app = app
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.redis_url = redis_url
+        self._redis = None
+        self._seq = count()
+        self._in_flight = 0
+        self._concurrency_limit = float(MAX_CONCURRENCY)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        key = f"rate-limit:{client_ip}:{scope['path']}"
+
+        request_count, retry_after = await self._count_request(key)
+        if request_count > self.limit:
+            await self._reject(send, 429, "Rate limit exceeded. Try again later.", "RateLimitExceeded", retry_after)
+            return
+
+        if self._in_flight >= self._concurrency_limit:
+            await self._reject(send, 503, "Server is overloaded. Try again later.", "ServerOverloaded", 1)
+            return
+
+        async def send_with_feedback(message):
+            if message["type"] == "http.response.start":
+                self._observe(message["status"])
+            await send(message)
+
+        self._in_flight += 1
+        try:
+            await self.app(scope, receive, send_with_feedback)
+        finally:
+            self._in_flight -= 1
+
+    def _observe(self, status):
+        """
+        Adjusts the AIMD concurrency limit from a response status.
+
+        Args:
+            status: HTTP status code of the downstream response.
+
+        Returns:
+            None
+        """
+        if status >= 500:
+            self._concurrency_limit = max(MIN_CONCURRENCY, self._concurrency_limit * MULTIPLICATIVE_DECREASE)
+        else:
+            self._concurrency_limit = min(MAX_CONCURRENCY, self._concurrency_limit + ADDITIVE_INCREASE)
+
+    async def _reject(self, send, status, detail, error_type, retry_after):
+        """
+        Sends a JSON rejection response without entering the app.
+
+        Args:
+            send: The ASGI send callable.
+            status: HTTP status code of the rejection.
+            detail: Human-readable error message.
+            error_type: Machine-readable error identifier.
+            retry_after: Seconds the client should wait before retrying.
+
+        Returns:
+            None
+        """
+        body = orjson.dumps({
+            "detail": detail,
+            "type": error_type,
+            "retry_after": retry_after,
+        })
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+                (b"x-ratelimit-limit", str(self.limit).encode()),
+                (b"x-ratelimit-remaining", b"0"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _count_request(self, key):
+        """
+        Records the request and returns the count inside the window.
+
+        Args:
+            key: Counter key identifying the client and path.
+
+        Returns:
+            Tuple of (requests seen this window, seconds until a slot frees).
+        """
+        now = time.time()
+        cutoff = now - self.window_seconds
+        try:
+            if self._redis is None:
+                self._redis = redis.from_url(self.redis_url, encoding="utf8", decode_responses=True)
+            pipe = self._redis.pipeline()
+            pipe.zremrangebyscore(key, 0, cutoff)
+            pipe.zadd(key, {f"{now:.6f}-{next(self._seq)}": now})
+            pipe.zcard(key)
+            pipe.expire(key, self.window_seconds)
+            _, _, request_count, _ = await pipe.execute()
+            if request_count <= self.limit:
+                return request_count, 0
+            oldest = await self._redis.zrange(key, 0, 0, withscores=True)
+            retry_after = int(self.window_seconds - (now - oldest[0][1])) + 1 if oldest else self.window_seconds
+            return request_count, retry_after
+        except Exception:
+            window = _FALLBACK_WINDOWS.setdefault(key, deque())
+            while window and window[0] <= cutoff:
+                window.popleft()
+            window.append(now)
+            request_count = len(window)
+            if request_count <= self.limit:
+                return request_count, 0
+            return request_count, int(self.window_seconds - (now - window[0])) + 1
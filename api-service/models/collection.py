@@ -1,6 +1,6 @@
 # Imports
 # Standard Library Imports
-from sqlalchemy import Column, JSON, String
+from sqlalchemy import Column, DateTime, JSON, String, func
 from database.postgre import Base
 
 
@@ -31,6 +31,7 @@ class Collection(Base):
     extent = Column(JSON, nullable=False)
     links = Column(JSON, nullable=False)
     providers = Column(JSON, nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     
     def __repr__(self):
         return f"id='{self.id}'"
\ No newline at end of file
@@ -0,0 +1,97 @@
+# Imports
+# Standard Library Imports
+from sqlalchemy import CheckConstraint, Column, BigInteger, DateTime, Float, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, BYTEA
+
+# Local Imports
+from database.postgre import Base
+
+
+############################################################################################################
+# Stac Model
+############################################################################################################
+class Stac(Base):
+    """
+    Stac model for storing the STAC item metadata of every product.
+
+    Columns are right-sized to the actual data so more rows fit per page,
+    and `s3_urls` is a native PostgreSQL array instead of a delimited blob.
+
+    Args:
+        Base: Base class for declarative models for SQLAlchemy.
+
+    Attributes:
+        __tablename__: Name of the table in the database.
+        __table_args__: Additional table arguments, such as schema.
+        id: Primary key of the STAC item.
+        type: The type of the STAC item.
+        geom_type: The type of geometry.
+        bounding_box_wkb: Hex-encoded WKB of the bounding box geometry.
+        beam_mode: The beam mode of the STAC item.
+        browse: The URL of the browse image.
+        bytes: The size of the STAC item in bytes.
+        center_lat: The latitude of the center point.
+        center_lon: The longitude of the center point.
+        product_name: The name of the product.
+        product_file: The name of the product file.
+        orbit_direction: Orbit direction of the platform.
+        md5_sum: Raw 16-byte MD5 digest of the file.
+        orbit_absolute_number: Absolute orbit number.
+        processor_version: Version of the processing software.
+        satellite_name: Satellite name.
+        polarization: Polarization mode.
+        processing_time: Time the item was processed.
+        product_level: Processing level, such as GRD or SLC.
+        acquisition_start_utc: Acquisition start time.
+        acquisition_end_utc: Acquisition stop time.
+        s3_urls: S3 URLs where the assets are stored.
+        assets: Main URL for the STAC item.
+
+    Returns:
+        None
+    """
+    __tablename__ = 'stac'
+    __table_args__ = (
+        CheckConstraint(
+            "orbit_direction IN ('ASCENDING', 'DESCENDING')",
+            name='ck_stac_orbit_direction',
+        ),
+        Index(
+            'ix_stac_acq_start_ascending',
+            'acquisition_start_utc',
+            postgresql_where="orbit_direction = 'ASCENDING'",
+        ),
+        Index(
+            'ix_stac_acq_start_descending',
+            'acquisition_start_utc',
+            postgresql_where="orbit_direction = 'DESCENDING'",
+        ),
+        {'schema': 'piersight_stac'},
+    )
+
+    id = Column(String(32), primary_key=True, index=True)
+    type = Column(String(16), nullable=True)
+    geom_type = Column(String(16), nullable=True)
+    bounding_box_wkb = Column(Text, nullable=True)
+    beam_mode = Column(String(32), nullable=True)
+    browse = Column(String(256), nullable=True)
+    bytes = Column(BigInteger, nullable=True)
+    center_lat = Column(Float, nullable=True)
+    center_lon = Column(Float, nullable=True)
+    product_name = Column(String(64), nullable=False, index=True)
+    product_file = Column(String(64), nullable=True)
+    orbit_direction = Column(String(16), nullable=True)
+    md5_sum = Column(BYTEA, nullable=True)
+    orbit_absolute_number = Column(Integer, nullable=True)
+    processor_version = Column(String(16), nullable=True)
+    satellite_name = Column(String(32), nullable=True, index=True)
+    polarization = Column(String(8), nullable=True)
+    processing_time = Column(DateTime(timezone=True), nullable=True)
+    product_level = Column(String(16), nullable=True)
+    acquisition_start_utc = Column(DateTime(timezone=True), nullable=True)
+    acquisition_end_utc = Column(DateTime(timezone=True), nullable=True)
+    s3_urls = Column(ARRAY(Text), nullable=True)
+    assets = Column(String(256), nullable=True)
+
+    def __repr__(self):
+        return f"id='{self.id}'"
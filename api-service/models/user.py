@@ -1,8 +1,7 @@
 # Imports
 # Standard Library Imports
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime
-from sqlalchemy_utils import EmailType
+from sqlalchemy import CheckConstraint, Column, Integer, String, DateTime
 
 # Local Imports
 from database.postgre import Base
@@ -30,9 +29,12 @@ class User(Base):
         None
     """
     __tablename__ = 'user'
-    __table_args__ = {'schema': 'stac_metadata'}
-    
+    __table_args__ = (
+        CheckConstraint("email ~* '^[^@]+@[^@]+\\.[^@]+$'", name='ck_user_email_format'),
+        {'schema': 'stac_metadata'},
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    email = Column(EmailType, nullable=False, index=True, unique=True)
+    email = Column(String(254), nullable=False, index=True, unique=True)
     password = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.now())
\ No newline at end of file
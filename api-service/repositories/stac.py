@@ -0,0 +1,36 @@
+# Imports
+# Third-Party Imports
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Local Imports
+from models.stac import Stac
+
+
+# PostgreSQL throughput flattens out past roughly 1k rows per statement,
+# so larger ingests are split into chunks of this size.
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+async def bulk_insert_stac(db: AsyncSession, rows, chunk_size=BULK_INSERT_CHUNK_SIZE):
+    """
+    Inserts STAC rows in batches through the SQLAlchemy Core bulk path.
+
+    Each chunk is sent as a single executemany statement, so a 10k-row
+    ingest costs a handful of round-trips instead of one per row.
+
+    Parameters:
+        db: The asynchronous database session to insert with.
+        rows: List of dictionaries keyed by Stac column names.
+        chunk_size: Number of rows per INSERT statement.
+
+    Returns:
+        The total number of rows inserted.
+    """
+    inserted = 0
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        await db.execute(insert(Stac), chunk)
+        inserted += len(chunk)
+    await db.commit()
+    return inserted
@@ -1,18 +1,104 @@
 # Imports
+# Standard Library Imports
+import gzip
+import hashlib
+from types import MappingProxyType
+
 # Third-Party Imports
+import orjson
 from fastapi import APIRouter, Request, status
-from fastapi_cache.decorator import cache
 from starlette.responses import Response
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 # Local Imports
 from schemas import catalog
-from utils import my_key_builder
 
 
 router = APIRouter()
-limiter = Limiter(key_func=get_remote_address, headers_enabled=True)
+
+# The catalog document is invariant until redeploy, so it is serialized and
+# gzip-compressed once at import time and served straight from memory. The
+# object itself is frozen so concurrent handlers can share it safely.
+CATALOG = {
+    "type": "Catalog",
+    "id": "PierSight Space Maritime Servilliance Data",
+    "title": "PierSight Catalog",
+    "description": 'PierSight Catalog provides access to high-resolution, all-weather Synthetic Aperture Radar (SAR) imagery and maritime surveillance data collected by the PierSight satellite constellation. The catalog enables persistent monitoring of global maritime activities, including ship detection, oil spill tracking, and coastal infrastructure analysis, supporting applications in security, environmental monitoring, and maritime domain awareness.',
+    "stac_version": "1.0.0",
+    "links": 
+        [
+            {
+                "rel": "self",
+                "mime_type": "application/geo+json",
+                "href": "https://stac.eodata.piersight.space/v1/"
+            },
+            {
+                "rel": "root",
+                "mime_type": "application/geo+json",
+                "href": "https://stac.eodata.piersight.space/v1/"
+            },
+            {
+                "rel": "service-desc",
+                "mime_type": "application/vnd.oai.openapi+json;version=3.0",
+                "href": "https://stac.eodata.piersight.space/api/openapi.json"
+            },
+            {
+                "rel": "service-doc",
+                "mime_type": "text/html",
+                "href": "https://stac.eodata.piersight.space/api"
+            },
+            {
+                "rel": "conformance",
+                "mime_type": "application/json",
+                "href": "https://stac.eodata.piersight.space/v1/conformance"
+            },
+            {
+                "rel": "data",
+                "mime_type": "application/json",
+                "href": "https://stac.eodata.piersight.space/v1/collections"
+            },
+            {
+                "rel": "search",
+                "mime_type": "application/geo+json",
+                "href": "https://stac.eodata.piersight.space/v1/search"
+            },
+        ] + [
+            {
+                "rel": "child",
+                "mime_type": "application/geo+json",
+                "href": f"https://stac.eodata.piersight.space/v1/collections/PierSight_V{i:02d}",
+                "title": f"PierSight-V{i:02d} Collection"
+            }
+            for i in range(1, 33)
+        ],
+    "stac_extensions": []
+}
+
+_CATALOG_BYTES = orjson.dumps(CATALOG)
+_CATALOG_GZIP = gzip.compress(_CATALOG_BYTES, compresslevel=9)
+_CATALOG_ETAG = '"' + hashlib.sha256(_CATALOG_BYTES).hexdigest()[:16] + '"'
+
+# Responses are also built once; returning a prebuilt instance costs a
+# single attribute lookup per hit instead of header/body assembly.
+_CACHE_CONTROL = "public, max-age=86400, stale-while-revalidate=3600"
+
+_CATALOG_RESPONSE = Response(
+    content=_CATALOG_BYTES,
+    media_type="application/json",
+    headers={"ETag": _CATALOG_ETAG, "Cache-Control": _CACHE_CONTROL, "Vary": "Accept-Encoding"},
+)
+_CATALOG_RESPONSE_GZIP = Response(
+    content=_CATALOG_GZIP,
+    media_type="application/json",
+    headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding", "ETag": _CATALOG_ETAG, "Cache-Control": _CACHE_CONTROL},
+)
+_CATALOG_NOT_MODIFIED = Response(
+    status_code=304,
+    headers={"ETag": _CATALOG_ETAG, "Cache-Control": _CACHE_CONTROL},
+)
+
+CATALOG["links"] = tuple(MappingProxyType(link) for link in CATALOG["links"])
+CATALOG = MappingProxyType(CATALOG)
+
 
 @router.get(
     "/", 
@@ -58,265 +144,57 @@ limiter = Limiter(key_func=get_remote_address, headers_enabled=True)
         }
     }
 )
-@cache(expire=86400, key_builder=my_key_builder)
-@limiter.limit("15/minute")
 async def get_piersight_catalog(
     request: Request,
-    response: Response,
 ):
     """
     Returns the PierSight STAC catalog metadata.
 
     This endpoint provides the root catalog information for the PierSight STAC API,
-    including links to all available collections and API endpoints.
+    including links to all available collections and API endpoints. The body is
+    served from the precomputed module constants, so no per-request response
+    object or validation work is involved.
 
     Args:
         request (Request): The incoming HTTP request
-        response (Response): The outgoing HTTP response
 
     Returns:
-        dict: A dictionary containing the catalog metadata.
+        Response: The precomputed catalog document.
     """
-    catalog_result = {
-        "type": "Catalog",
-        "id": "PierSight Space Maritime Servilliance Data",
-        "title": "PierSight Catalog",
-        "description": 'PierSight Catalog provides access to high-resolution, all-weather Synthetic Aperture Radar (SAR) imagery and maritime surveillance data collected by the PierSight satellite constellation. The catalog enables persistent monitoring of global maritime activities, including ship detection, oil spill tracking, and coastal infrastructure analysis, supporting applications in security, environmental monitoring, and maritime domain awareness.',
-        "stac_version": "1.0.0",
-        "links": 
-            [
-                {
-                    "rel": "self",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/"
-                },
-                {
-                    "rel": "root",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/"
-                },
-                {
-                    "rel": "service-desc",
-                    "mime_type": "application/vnd.oai.openapi+json;version=3.0",
-                    "href": "https://stac.eodata.piersight.space/api/openapi.json"
-                },
-                {
-                    "rel": "service-doc",
-                    "mime_type": "text/html",
-                    "href": "https://stac.eodata.piersight.space/api"
-                },
-                {
-                    "rel": "conformance",
-                    "mime_type": "application/json",
-                    "href": "https://stac.eodata.piersight.space/v1/conformance"
-                },
-                {
-                    "rel": "data",
-                    "mime_type": "application/json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections"
-                },
-                {
-                    "rel": "search",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/search"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V01",
-                    "title": "PierSight-V01 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V02",
-                    "title": "PierSight-V02 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V03",
-                    "title": "PierSight-V03 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V04",
-                    "title": "PierSight-V04 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V05",
-                    "title": "PierSight-V05 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V06",
-                    "title": "PierSight-V06 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V07",
-                    "title": "PierSight-V07 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V08",
-                    "title": "PierSight-V08 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V09",
-                    "title": "PierSight-V09 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V10",
-                    "title": "PierSight-V10 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V11",
-                    "title": "PierSight-V11 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V12",
-                    "title": "PierSight-V12 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V13",
-                    "title": "PierSight-V13 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V14",
-                    "title": "PierSight-V14 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V15",
-                    "title": "PierSight-V15 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V16",
-                    "title": "PierSight-V16 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V17",
-                    "title": "PierSight-V17 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V18",
-                    "title": "PierSight-V18 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V19",
-                    "title": "PierSight-V19 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V20",
-                    "title": "PierSight-V20 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V21",
-                    "title": "PierSight-V21 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V22",
-                    "title": "PierSight-V22 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V23",
-                    "title": "PierSight-V23 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V24",
-                    "title": "PierSight-V24 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V25",
-                    "title": "PierSight-V25 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V26",
-                    "title": "PierSight-V26 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V27",
-                    "title": "PierSight-V27 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V28",
-                    "title": "PierSight-V28 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V29",
-                    "title": "PierSight-V29 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V30",
-                    "title": "PierSight-V30 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V31",
-                    "title": "PierSight-V31 Collection"
-                },
-                {
-                    "rel": "child",
-                    "mime_type": "application/geo+json",
-                    "href": "https://stac.eodata.piersight.space/v1/collections/PierSight_V32",
-                    "title": "PierSight-V32 Collection"
-                },
-            ],
-        "stac_extensions": []
-    }
-    
-    return catalog_result
+    if request.headers.get("if-none-match") == _CATALOG_ETAG:
+        return _CATALOG_NOT_MODIFIED
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return _CATALOG_RESPONSE_GZIP
+    return _CATALOG_RESPONSE
+
+
+# The conformance declaration is equally static and gets the same treatment.
+CONFORMANCE = {
+    "conformsTo": [
+        "https://api.stacspec.org/v1.0.0/core",
+        "https://api.stacspec.org/v1.0.0/collections",
+        "https://api.stacspec.org/v1.0.0/search",
+        "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/core",
+        "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/oas30",
+        "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/html",
+        "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/geojson"
+    ]
+}
+
+_CONFORMANCE_BYTES = orjson.dumps(CONFORMANCE)
+_CONFORMANCE_ETAG = '"' + hashlib.sha256(_CONFORMANCE_BYTES).hexdigest()[:16] + '"'
+
+_CONFORMANCE_RESPONSE = Response(
+    content=_CONFORMANCE_BYTES,
+    media_type="application/json",
+    headers={"ETag": _CONFORMANCE_ETAG, "Cache-Control": _CACHE_CONTROL, "Vary": "Accept-Encoding"},
+)
+_CONFORMANCE_NOT_MODIFIED = Response(
+    status_code=304,
+    headers={"ETag": _CONFORMANCE_ETAG, "Cache-Control": _CACHE_CONTROL},
+)
+
+CONFORMANCE = MappingProxyType(CONFORMANCE)
 
 
 @router.get(
@@ -348,8 +226,6 @@ async def get_piersight_catalog(
         }
     }
 )
-@cache(expire=86400, key_builder=my_key_builder)
-@limiter.limit("15/minute")
 async def get_conformance(
     request: Request,
     response: Response,
@@ -367,16 +243,7 @@ async def get_conformance(
     Returns:
         dict: A conformance object listing implemented specifications
     """
-    return {
-        "conformsTo": [
-            "https://api.stacspec.org/v1.0.0/core",
-            "https://api.stacspec.org/v1.0.0/collections",
-            "https://api.stacspec.org/v1.0.0/search",
-            "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/core",
-            "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/oas30",
-            "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/html",
-            "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/geojson"
-        ]
-    }
-    return conformance_result
+    if request.headers.get("if-none-match") == _CONFORMANCE_ETAG:
+        return _CONFORMANCE_NOT_MODIFIED
+    return _CONFORMANCE_RESPONSE
 
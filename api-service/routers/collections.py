@@ -3,24 +3,93 @@
 from typing import Optional, List
 
 # Third-Party Imports
+import orjson
 from fastapi import Depends, HTTPException, Request, APIRouter, status
+from fastapi.routing import APIRoute
+from fastapi_cache import FastAPICache
 from fastapi_cache.decorator import cache
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from starlette.responses import Response
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 # Local Imports
 from database.postgre import get_db
 from models import collection as collection_model
 from schemas import collection
 from utils import my_key_builder
-from config.settings import COLLECTIONS
+from config.settings import COLLECTIONS, CACHE_TTL_LONG
 
 
-router = APIRouter()
-limiter = Limiter(key_func=get_remote_address, headers_enabled=True)
+class _ORJSONRequest(Request):
+    """
+    Request subclass that parses JSON bodies with orjson.
+
+    The bulk-collection payloads are the largest bodies this API
+    accepts; orjson parses them several times faster than the stdlib
+    json the default Request.json() uses and builds fewer intermediate
+    objects along the way.
+    """
+
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """
+    Route class that feeds handlers orjson-parsed request bodies.
+
+    Only the collections router carries request bodies, so only it opts
+    in; the GET-only routers keep the default route class.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request):
+            return await handler(_ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+
+router = APIRouter(route_class=ORJSONRoute)
+
+# Statements are compiled once at import; handlers only bind parameters.
+_SELECT_ALL_COLLECTIONS = select(collection_model.Collection)
+_SELECT_COLLECTION_BY_ID = select(collection_model.Collection).where(
+    collection_model.Collection.id == bindparam("cid")
+)
+_SELECT_COLLECTION_UPDATED_AT = select(collection_model.Collection.updated_at).where(
+    collection_model.Collection.id == bindparam("cid")
+)
+
+# In-process hot cache for collection bodies, keyed by ID. Freshness is
+# still decided by the cheap updated_at probe: a hit only skips the
+# second query and the row-to-dict conversion when the stored ETag
+# matches. The universe is the 32 known collections, so no eviction.
+_COLLECTION_CACHE = {}
+
+
+def _row_to_dict(row):
+    """
+    Converts an ORM collection row to a plain JSON-ready dict.
+
+    Args:
+        row: The Collection ORM instance to convert.
+
+    Returns:
+        dict: The column values without SQLAlchemy internals.
+    """
+    if isinstance(row, dict):
+        return row
+    # updated_at only feeds the ETag; keep it off the wire.
+    return {
+        key: value
+        for key, value in row.__dict__.items()
+        if not key.startswith('_') and key != 'updated_at'
+    }
 
 @router.post(
     "/collections",
@@ -83,31 +152,110 @@ async def create_collection(
             - 500: For other database errors
     """
     try:
-        existing = await db.execute(
-            select(collection_model.Collection).where(collection_model.Collection.id == new_collection.id)
+        collection_data = new_collection.model_dump(mode="json")
+
+        insert_query = (
+            pg_insert(collection_model.Collection)
+            .values(**collection_data)
+            .on_conflict_do_nothing(index_elements=['id'])
+            .returning(collection_model.Collection.id)
         )
-        if existing.scalars().all():
+        result = await db.execute(insert_query)
+        inserted_id = result.scalar_one_or_none()
+        if inserted_id is None:
             raise HTTPException(status_code=409, detail=f"Collection with ID '{new_collection.id}' already exists")
-        collection_data = new_collection.dict()
-        for link in collection_data["links"]:
-            link['href'] = str(link['href'])
-        if 'providers' in collection_data:
-            for provider in collection_data['providers']:
-                provider['url'] = str(provider['url'])
-                
-        new_collection_to_db = collection_model.Collection(**collection_data)
-        db.add(new_collection_to_db)
         await db.commit()
-        await db.refresh(new_collection_to_db)
-        
+        _COLLECTION_CACHE.pop(new_collection.id, None)
+        await FastAPICache.clear(namespace="collections")
+
         return new_collection
+    except HTTPException:
+        raise
     except Exception as e:
-        HTTPException(status_code=500, detail=f"Error creating collection: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error creating collection: {str(e)}")
+
+
+@router.post(
+    "/collections:bulk",
+    summary="Create Collections in Bulk",
+    description="""
+    Create multiple STAC collections in a single request.
+
+    Accepts a list of collections and inserts them with one batched
+    statement and one commit, instead of one round trip per collection.
+    Collections whose IDs already exist are skipped.
+    """,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        201: {
+            "description": "Bulk insert completed",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "inserted": 30,
+                        "skipped": 2
+                    }
+                }
+            }
+        },
+        422: {
+            "description": "Validation error in collection data",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Invalid collection data: missing required field 'extent'"
+                    }
+                }
+            }
+        }
+    }
+)
+async def create_collections_bulk(
+    new_collections: List[collection.CollectionModel],
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Creates multiple STAC collections in one batched insert.
+
+    Args:
+        new_collections: The list of collections to create
+        db: Database session dependency
+
+    Returns:
+        dict: Counts of inserted and skipped (already existing) collections
+
+    Raises:
+        HTTPException:
+            - 422: If there is a validation error
+            - 500: For other database errors
+    """
+    try:
+        if not new_collections:
+            return {"inserted": 0, "skipped": 0}
+
+        rows = [c.model_dump(mode="json") for c in new_collections]
+        insert_query = (
+            pg_insert(collection_model.Collection)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=['id'])
+            .returning(collection_model.Collection.id)
+        )
+        result = await db.execute(insert_query)
+        inserted = len(result.scalars().all())
+        await db.commit()
+        if inserted:
+            _COLLECTION_CACHE.clear()
+            await FastAPICache.clear(namespace="collections")
+
+        return {"inserted": inserted, "skipped": len(rows) - inserted}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error creating collections: {str(e)}")
 
 
 @router.get(
     "/collections",
-    response_model=List[collection.CollectionModel],
     summary="List Collections",
     description="""
     Retrieves all available collections in the catalog.
@@ -145,8 +293,7 @@ async def create_collection(
         }
     }
 )
-@cache(expire=86400, key_builder=my_key_builder)
-@limiter.limit("15/minute")
+@cache(expire=CACHE_TTL_LONG, namespace="collections", key_builder=my_key_builder)
 async def get_all_collections(
     request: Request,
     response: Response,
@@ -167,31 +314,17 @@ async def get_all_collections(
         HTTPException: 500 if there is an error retrieving the collections
     """
     try:
-        collection_query = await db.execute(select(collection_model.Collection))
+        collection_query = await db.execute(_SELECT_ALL_COLLECTIONS)
         collections = collection_query.scalars().all()
-        print(f"Fetched {len(collections)} collections from the database")
-        collection_list = [
-            collection_model.Collection(
-                id=col.id,
-                type=col.type,
-                stac_version=col.stac_version,
-                description=col.description,
-                license=col.license,
-                title=col.title,
-                extent=col.extent,
-                links=col.links,
-                providers=col.providers,
-            )
-            for col in collections]
-        
-        return collection_list
+        response.headers["Cache-Control"] = "public, max-age=86400, stale-while-revalidate=3600"
+        response.headers["Vary"] = "Accept-Encoding"
+        return [_row_to_dict(c) for c in collections]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"{str(e)}")
     
 
 @router.get(
     "/collections/{collectionId}",
-    response_model=collection.CollectionModel,
     summary="Get Collection",
     description="""
     Retrieve a specific collection by its identifier.
@@ -237,8 +370,6 @@ async def get_all_collections(
         }
     }
 )
-@cache(expire=86400, key_builder=my_key_builder)
-@limiter.limit("15/minute")
 async def get_collection(
     request: Request,
     response : Response,
@@ -253,38 +384,80 @@ async def get_collection(
         response: The outgoing HTTP response
         collectionId: The ID of the collection to retrieve
         db: Database session dependency
-        
+
     Returns:
         CollectionModel: The requested collection's metadata
-    
+
     Raises:
-        HTTPException: 
+        HTTPException:
+            - 404: If collection is not found
+            - 500: For other errors
+    """
+    payload = await _collection_payload(request=request, collectionId=collectionId, db=db)
+    etag = payload["etag"]
+    # Revalidation happens outside the cached scope: a conditional
+    # request can read the shared entry but never replaces it, so other
+    # clients keep getting the full body.
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "public, max-age=86400, stale-while-revalidate=3600"
+    response.headers["Vary"] = "Accept-Encoding"
+    return payload["body"]
+
+
+@cache(expire=CACHE_TTL_LONG, namespace="collections", key_builder=my_key_builder)
+async def _collection_payload(
+    request: Request,
+    collectionId: str,
+    db: AsyncSession,
+):
+    """
+    Fetches a collection row and its ETag as a plain payload dict.
+
+    This is the cached scope: it only ever returns data, never a
+    Response object, so the backend stores the body/etag pair itself.
+
+    Args:
+        request: The incoming HTTP request (feeds the cache key)
+        collectionId: The ID of the collection to retrieve
+        db: Database session dependency
+
+    Returns:
+        dict: The collection body and its ETag
+
+    Raises:
+        HTTPException:
             - 404: If collection is not found
             - 500: For other errors
     """
     try:
         if not collectionId:
             raise HTTPException(status_code=404, detail="Collection ID cannot be empty")
-        if collectionId not in COLLECTIONS:  
-            print(f"Invalid collection ID: {collectionId}")                
+        if collectionId not in COLLECTIONS:
+            print(f"Invalid collection ID: {collectionId}")
             raise HTTPException(status_code=404, detail="Invalid satellite")
-        
-        collection_query = await db.execute(select(collection_model.Collection).where(collection_model.Collection.id==collectionId))
-        collections = collection_query.scalars().all()
-        collection_list = [
-            collection_model.Collection(
-                id=col.id,
-                type=col.type,
-                stac_version=col.stac_version,
-                description=col.description,
-                license=col.license,
-                title=col.title,
-                extent=col.extent,
-                links=col.links,
-                providers=col.providers,
-            )
-            for col in collections]
-        return collection_list
+
+        # Cheap indexed probe first: the row timestamp decides freshness
+        # before the full row is hydrated and serialized.
+        updated_at = (
+            await db.execute(_SELECT_COLLECTION_UPDATED_AT, {"cid": collectionId})
+        ).scalar_one_or_none()
+        if updated_at is None:
+            raise HTTPException(status_code=404, detail=f"Collection '{collectionId}' not found")
+        etag = f'"{int(updated_at.timestamp() * 1000):x}"'
+
+        cached = _COLLECTION_CACHE.get(collectionId)
+        if cached is not None and cached[0] == etag:
+            return {"etag": etag, "body": cached[1]}
+
+        collection_query = await db.execute(_SELECT_COLLECTION_BY_ID, {"cid": collectionId})
+        collection_row = collection_query.scalar_one_or_none()
+        if collection_row is None:
+            raise HTTPException(status_code=404, detail=f"Collection '{collectionId}' not found")
+        body = _row_to_dict(collection_row)
+        _COLLECTION_CACHE[collectionId] = (etag, body)
+        return {"etag": etag, "body": body}
     except HTTPException:
         raise
     except Exception as e:
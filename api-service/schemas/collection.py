@@ -3,7 +3,7 @@
 from typing import Optional, List
 
 # Third-Party Imports
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, HttpUrl, field_serializer
 
 # Local Imports
 from .catalog import Links
@@ -27,10 +27,12 @@ class Provider(BaseModel):
     name: str
     roles: Optional[List[str]] = []
     url: Optional[HttpUrl] = None
-    
-    class Config:
-        form_attribute = True
-        etra = "forbid" 
+
+    @field_serializer('url', when_used='always')
+    def _serialize_url(self, url: Optional[HttpUrl]) -> Optional[str]:
+        return None if url is None else str(url)
+
+    model_config = ConfigDict(from_attributes=True, extra="forbid", frozen=True)
 
 
 class Extent(BaseModel):
@@ -47,10 +49,8 @@ class Extent(BaseModel):
     """
     spatial: dict = {}
     temporal: dict = {}
-    
-    class Config:
-        form_attribute = True
-        extra = "forbid"
+
+    model_config = ConfigDict(from_attributes=True, extra="forbid", frozen=True)
         
         
 class CollectionModel(BaseModel):
@@ -81,7 +81,5 @@ class CollectionModel(BaseModel):
     extent: Extent = Extent()
     links: List[Links] = []
     providers: Optional[List[Provider]] = []
-    
-    class Config:
-        form_attribute = True
-        extra = "forbid"
\ No newline at end of file
+
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
\ No newline at end of file
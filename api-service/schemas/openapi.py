@@ -0,0 +1,201 @@
+# Imports
+# (module constants only; no runtime dependencies)
+
+############################################################################################################
+# OpenAPI Response Documentation
+############################################################################################################
+# These dicts only feed the generated docs. Declaring them once at
+# module scope means each worker builds a single shared object instead
+# of reconstructing a multi-kilobyte literal per route decorator.
+
+SEARCH_RESPONSES = {
+    200: {
+        "description": "Successfully retrieved matching STAC items",
+        "content": {
+            "application/json": {
+                "example": {
+                    "type": "FeatureCollection",
+                    "features": [
+                        {
+                            "type": "Feature",
+                            "geom_type": "Polygon",
+                            "bounding_box_wkb": {
+                                "coordinates": [[]]
+                            },
+                            # Other fields
+                        }
+                    ],
+                    "next": None
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Invalid input parameters.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "acquisition_start_utc: 2023-01-01T00:00:00 is exceeding acquisition_end_utc: 2022-12-31T23:59:59"
+                }
+            }
+        }
+    },
+    404: {
+        "description": "No data found for the given input.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "No data found for given input"
+                }
+            }
+        }
+    },
+    422: {
+        "description": "Invalid coordinates or time format.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Invalid coordinates; Must be in WKT format"
+                }
+            }
+        }
+    },
+    429: {
+        "description": "Too many requests",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Rate limit exceeded. Try again later."
+                }
+            }
+        }
+    }
+}
+
+ITEMS_LIST_RESPONSES = {
+    200: {
+        "description": "A paginated response containing STAC items.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "total_count": 100,
+                    "products": [
+                        {
+                            "id": "item1",
+                            "type": "Feature",
+                            "geom_type": "Polygon",
+                            "bounding_box_wkb": {
+                                "coordinates": [[]]
+                            },
+                            # Other fields
+                        }
+                    ],
+                    "next": None
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Invalid input parameters.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "start_time: 2023-01-01T00:00:00 is exceeding stop_time: 2022-12-31T23:59:59"
+                }
+            }
+        }
+    },
+    404: {
+        "description": "No data found for the given input.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "No data found for given input"
+                }
+            }
+        }
+    },
+    422: {
+        "description": "Invalid coordinates or time format.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Invalid coordinates; Must be in WKT format"
+                }
+            }
+        }
+    }
+}
+
+ITEM_DETAIL_RESPONSES = {
+    200: {
+        "description": "A paginated response containing STAC items.",
+        "content": {
+            "application/geo+json": {
+                "example": {
+                    "total_count": 100,
+                    "products": [
+                        {
+                            "id": "item1",
+                            "type": "Feature",
+                            "geom_type": "Polygon",
+                            "bounding_box_wkb": {
+                                "coordinates": [[]]
+                            },
+                            # Other fields
+                        }
+                    ],
+                    "next": None
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Invalid satellite.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Invalid satellite"
+                }
+            }
+        }
+    },
+    404: {
+        "description": "No item found for satellite.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "No item found for satellite."
+                }
+            }
+        }
+    },
+    422: {
+        "description": "Invalid coordinates or time format.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Invalid coordinates; Must be in WKT format"
+                }
+            }
+        }
+    }
+}
+
+ITEM_DOWNLOAD_RESPONSES = {
+    307: {
+        "description": "Redirect to a presigned S3 URL for the asset."
+    },
+    400: {
+        "description": "Invalid collection ID provided."
+    },
+    403: {
+        "description": "Insufficient permissions to access the asset."
+    },
+    404: {
+        "description": "The requested asset was not found."
+    },
+    500: {
+        "description": "A server-side error occurred while accessing the asset."
+    }
+}
@@ -4,7 +4,7 @@ from typing import Optional, List
 from datetime import datetime, date
 
 # Third-Party Imports
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 ############################################################################################################
@@ -18,13 +18,19 @@ class Geometry(BaseModel):
         BaseModel: Base class for pydantic models.
 
     Attributes:
-        coordinates: A list of coordinates representing the geometry.
-    
+        coordinates: The exterior ring as a list of [lon, lat] points.
+
     Returns:
         None
     """
-    coordinates: list
-    
+    # Typed all the way down so pydantic-core validates the float pairs
+    # in its tight Rust loop instead of falling back to the generic
+    # any-object list validator.
+    coordinates: List[List[float]]
+
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
+
 class StacBase(BaseModel):
     """
     StacBase model for storing STAC metadata in a model.
@@ -88,7 +94,9 @@ class StacBase(BaseModel):
     acquisition_start_utc: Optional[datetime] = None
     acquisition_end_utc: Optional[datetime] = None
     assets: Optional[str] = None
-    
+
+    model_config = ConfigDict(from_attributes=True, extra="forbid", defer_build=True)
+
 
 class StacOutputBase(BaseModel):
     """
@@ -98,15 +106,19 @@ class StacOutputBase(BaseModel):
         total_count: Total number of STAC items available.
         products: List of STAC item metadata objects.
         next: URL or token for retrieving the next page of results, if any.
-
-    Config:
-        form_attribute: Indicates if the model should support form data.
-        extra: Controls how extra fields are handled.
     """
     total_count: int
     products: Optional[List[StacBase]] = []
     next: Optional[str] = None
-    
-    class Config:
-        form_attribute = True
-        extra = "forbid"
\ No newline at end of file
+
+    # Deferred: StacOutputBase only documents the response shape on the
+    # route decorators, so its validator is never needed until the
+    # OpenAPI document is first rendered.
+    model_config = ConfigDict(from_attributes=True, extra="forbid", defer_build=True)
+
+
+# Shared list adapter for paginated responses. TypeAdapter compiles its
+# pydantic-core schema when constructed, so one module-level instance
+# means every page of every endpoint reuses the same compiled core
+# instead of each router building its own.
+STAC_LIST_ADAPTER = TypeAdapter(List[StacBase])
\ No newline at end of file
@@ -1,7 +1,9 @@
+import asyncio
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 from unittest.mock import AsyncMock, patch
+from uuid import uuid4
 from fastapi.testclient import TestClient
 import redis.asyncio as redis
 
@@ -15,10 +17,12 @@ patcher_init = patch("fastapi_cache.FastAPICache.init", return_value=None)
 patcher_prefix = patch("fastapi_cache.FastAPICache.get_prefix", return_value="test-prefix")
 patcher_cache = patch("fastapi_cache.decorator.cache", side_effect=lambda *a, **kw: lambda f: f)
 patcher_coder = patch("fastapi_cache.FastAPICache.get_coder", return_value=None)
+patcher_clear = patch("fastapi_cache.FastAPICache.clear", new=AsyncMock(return_value=0))
 patcher_init.start()
 patcher_prefix.start()
 patcher_cache.start()
 patcher_coder.start()
+patcher_clear.start()
 
 try:
     from main import app
@@ -39,9 +43,16 @@ def client():
     """Synchronous test client"""
     return TestClient(app)
 
-@pytest_asyncio.fixture
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole run so session-scoped async fixtures work"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest_asyncio.fixture(scope="session")
 async def async_client():
-    """Async test client"""
+    """Async test client, shared across the run so transport setup is paid once"""
     try:
         from httpx import ASGITransport
         transport = ASGITransport(app=app)
@@ -51,47 +62,76 @@ async def async_client():
         print(f"Error creating async client: {e}")
         raise
 
+# Column order shared by every fake row; built once instead of a fresh
+# list literal per keys() call.
+_KEYS = (
+    'id', 'type', 'geom_type', 'bounding_box_wkb', 'browse', 'bytes',
+    'center_lat', 'center_lon', 'product_name', 'product_file',
+    'orbit_direction', 'md5_sum', 'orbit_absolute_number',
+    'processor_version', 'satellite_name', 'polarization',
+    'processing_time', 'product_level', 'acquisition_start_utc',
+    'acquisition_end_utc', 'assets'
+)
+
+class FakeScalarResult:
+    __slots__ = ('_all_value',)
+    def __init__(self, all_value):
+        self._all_value = all_value
+    def all(self):
+        return self._all_value
+
 class FakeResult:
+    __slots__ = ('_all_value', '_scalar_one_or_none_value', '_iter')
     def __init__(self, all_value=None, scalar_one_or_none_value=None):
         self._all_value = all_value or []
         self._scalar_one_or_none_value = scalar_one_or_none_value
     def scalars(self):
-        class FakeScalarResult:
-            def __init__(self, all_value):
-                self._all_value = all_value
-            def all(self):
-                return self._all_value
         return FakeScalarResult(self._all_value)
     def fetchall(self):
         return self._all_value
     def keys(self):
-        return [
-            'id', 'type', 'geom_type', 'bounding_box_wkb', 'browse', 'bytes',
-            'center_lat', 'center_lon', 'product_name', 'product_file',
-            'orbit_direction', 'md5_sum', 'orbit_absolute_number',
-            'processor_version', 'satellite_name', 'polarization',
-            'processing_time', 'product_level', 'acquisition_start_utc',
-            'acquisition_end_utc', 'assets'
-        ]
+        return _KEYS
     def scalar_one_or_none(self):
         return self._scalar_one_or_none_value
+    def __aiter__(self):
+        self._iter = iter(self._all_value)
+        return self
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+    def mappings(self):
+        keys = self.keys()
+        rows = [dict(zip(keys, row)) for row in self._all_value]
+
+        class _Mappings:
+            def __iter__(self):
+                return iter(rows)
+            def __aiter__(self):
+                self._it = iter(rows)
+                return self
+            async def __anext__(self):
+                try:
+                    return next(self._it)
+                except StopIteration:
+                    raise StopAsyncIteration
+
+        return _Mappings()
 
 @pytest.fixture
 def mock_db_session():
     """Mock database session"""
     mock_session = AsyncMock()
     mock_session.execute.return_value = FakeResult()
+    # stream() mirrors whatever result or failure execute() is primed with
+    def _stream_like_execute(*args, **kwargs):
+        if mock_session.execute.side_effect is not None:
+            raise mock_session.execute.side_effect
+        return mock_session.execute.return_value
+    mock_session.stream = AsyncMock(side_effect=_stream_like_execute)
     return mock_session
 
-@pytest.fixture(autouse=True)
-def mock_redis_and_cache():
-    """Mock Redis and FastAPI cache for all tests"""
-    with patch('fastapi_cache.FastAPICache.init') as mock_init:
-        with patch('redis.asyncio.from_url') as mock_redis:
-            with patch('fastapi_cache.decorator.cache') as mock_cache:
-                mock_cache.side_effect = lambda *args, **kwargs: lambda func: func
-                yield mock_redis
-
 @pytest.fixture
 def mock_s3_client():
     """Mock S3 client"""
@@ -156,32 +196,6 @@ def override_db_dependency(mock_db_session):
     app.dependency_overrides.pop(get_db, None)
     
 async def override_get_db():
-    class FakeScalarResult:
-        def __init__(self, all_value):
-            self._all_value = all_value
-        def all(self):
-            return self._all_value
-
-    class FakeResult:
-        def __init__(self, all_value=None, scalar_one_or_none_value=None):
-            self._all_value = all_value or []
-            self._scalar_one_or_none_value = scalar_one_or_none_value
-        def scalars(self):
-            return FakeScalarResult(self._all_value)
-        def fetchall(self):
-            return self._all_value
-        def keys(self):
-            return [
-                'id', 'type', 'geom_type', 'bounding_box_wkb', 'browse', 'bytes',
-                'center_lat', 'center_lon', 'product_name', 'product_file',
-                'orbit_direction', 'md5_sum', 'orbit_absolute_number',
-                'processor_version', 'satellite_name', 'polarization',
-                'processing_time', 'product_level', 'acquisition_start_utc',
-                'acquisition_end_utc', 'assets'
-            ]
-        def scalar_one_or_none(self):
-            return self._scalar_one_or_none_value
-        
     mock_session = AsyncMock()
     mock_session.execute.return_value = FakeResult()
     mock_session.commit = AsyncMock()
@@ -192,8 +206,34 @@ async def override_get_db():
     app.dependency_overrides[get_db] = override_get_db
 
 @pytest.fixture(autouse=True)
+def reset_collection_cache():
+    """Empty the in-process collection cache before each test"""
+    from routers.collections import _COLLECTION_CACHE
+    _COLLECTION_CACHE.clear()
+    yield
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """Reset the in-process rate limiter fallback state before each test"""
+    from middlewares.rate_limit_middleware import reset_fallback_windows
+    reset_fallback_windows()
+    yield
+
+@pytest.fixture(autouse=True)
+def isolate_cache_prefix():
+    """
+    Give every test its own cache key prefix.
+
+    Keys from one test can never collide with another's, so no Redis
+    round-trip (connect + FLUSHDB per test) is needed to isolate state.
+    """
+    prefix = f"test:{uuid4().hex}"
+    with patch("fastapi_cache.FastAPICache.get_prefix", return_value=prefix):
+        yield prefix
+
+@pytest_asyncio.fixture
 async def clear_redis():
-    """Clear Redis database before each test to reset rate limiter state"""
+    """Opt-in flush for tests that exercise real Redis-backed state"""
     try:
         client = redis.from_url("redis://127.0.0.1:6379", encoding="utf8", decode_responses=True)
         await client.flushdb()
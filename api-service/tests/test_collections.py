@@ -22,6 +22,14 @@ class FakeResult:
         ]
     def scalar_one_or_none(self):
         return self._scalar_one_or_none_value
+    def __aiter__(self):
+        self._iter = iter(self._all_value)
+        return self
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
 
 
 COLLECTION_DICT = {
@@ -73,10 +81,9 @@ class TestCollectionsEndpoints:
 
     @pytest.mark.asyncio
     async def test_create_collection_success(self, async_client: AsyncClient, mock_db_session, sample_collection_data):
-        mock_db_session.execute.return_value = []
-        mock_db_session.add = lambda x: None
-        mock_db_session.commit = lambda: None
-        mock_db_session.refresh = lambda x: None
+        mock_db_session.execute.return_value = FakeResult(
+            scalar_one_or_none_value=sample_collection_data["id"]
+        )
         sample_collection_data["links"][0]["mime_type"] = "application/json"
         sample_collection_data["providers"][0]["roles"] = ["producer"]
         response = await async_client.post("/v1/collections", json=sample_collection_data)
@@ -87,6 +94,17 @@ class TestCollectionsEndpoints:
         assert data["title"] == sample_collection_data["title"]
 
 
+    @pytest.mark.asyncio
+    async def test_create_collections_bulk(self, async_client: AsyncClient, mock_db_session, sample_collection_data):
+        mock_db_session.execute.return_value = FakeResult([sample_collection_data["id"]])
+        sample_collection_data["links"][0]["mime_type"] = "application/json"
+        sample_collection_data["providers"][0]["roles"] = ["producer"]
+        response = await async_client.post("/v1/collections:bulk", json=[sample_collection_data])
+        data = response.json()
+        assert response.status_code == 201
+        assert data["inserted"] == 1
+        assert data["skipped"] == 0
+
     @pytest.mark.asyncio
     async def test_create_collection_invalid_data(self, async_client: AsyncClient):
         invalid_data = {"id": 123}
@@ -95,7 +113,7 @@ class TestCollectionsEndpoints:
 
     @pytest.mark.asyncio
     async def test_collections_caching(self, async_client: AsyncClient, mock_db_session):
-        mock_db_session.execute.return_value = [COLLECTION_DICT]
+        mock_db_session.execute.return_value = FakeResult([COLLECTION_DICT])
         response1 = await async_client.get("/v1/collections")
         response2 = await async_client.get("/v1/collections")
         assert response1.status_code == 200
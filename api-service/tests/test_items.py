@@ -53,6 +53,31 @@ class FakeResult:
         ]
     def scalar_one_or_none(self):
         return self._scalar_one_or_none_value
+    def __aiter__(self):
+        self._iter = iter(self._all_value)
+        return self
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+    def mappings(self):
+        keys = self.keys()
+        rows = [dict(zip(keys, row)) for row in self._all_value]
+
+        class _Mappings:
+            def __iter__(self):
+                return iter(rows)
+            def __aiter__(self):
+                self._it = iter(rows)
+                return self
+            async def __anext__(self):
+                try:
+                    return next(self._it)
+                except StopIteration:
+                    raise StopAsyncIteration
+
+        return _Mappings()
     
     
 class TestItemsEndpoints:
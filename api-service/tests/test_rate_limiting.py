@@ -1,6 +1,71 @@
 import pytest
 from httpx import AsyncClient
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch
+
+from middlewares.rate_limit_middleware import (
+    RateLimitMiddleware,
+    MIN_CONCURRENCY,
+    MAX_CONCURRENCY,
+    ADDITIVE_INCREASE,
+)
+
+
+class FakeScalarResult:
+    def __init__(self, all_value):
+        self._all_value = all_value
+    def all(self):
+        return self._all_value
+
+class FakeResult:
+    def __init__(self, all_value=None, scalar_one_or_none_value=None):
+        self._all_value = all_value or []
+        self._scalar_one_or_none_value = scalar_one_or_none_value
+    def scalars(self):
+        return FakeScalarResult(self._all_value)
+    def fetchall(self):
+        return self._all_value
+    def keys(self):
+        return [
+            'id', 'type', 'stac_version', 'description', 'license',
+            'title', 'extent', 'links', 'providers'
+        ]
+    def scalar_one_or_none(self):
+        return self._scalar_one_or_none_value
+    def mappings(self):
+        keys = self.keys()
+        rows = [dict(zip(keys, row)) for row in self._all_value]
+
+        class _Mappings:
+            def __iter__(self):
+                return iter(rows)
+            def __aiter__(self):
+                self._it = iter(rows)
+                return self
+            async def __anext__(self):
+                try:
+                    return next(self._it)
+                except StopIteration:
+                    raise StopAsyncIteration
+
+        return _Mappings()
+
+
+async def _ok_app(scope, receive, send):
+    """Minimal downstream app for exercising the middleware directly"""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def _invoke(middleware, path="/v1/"):
+    """Runs one request through the middleware, returning (status, body messages)"""
+    sent = []
+    async def send(message):
+        sent.append(message)
+    async def receive():
+        return {"type": "http.request"}
+    scope = {"type": "http", "path": path, "client": ("203.0.113.7", 1234)}
+    await middleware(scope, receive, send)
+    return sent[0]["status"], sent
 
 
 class TestRateLimiting:
@@ -9,17 +74,17 @@ class TestRateLimiting:
     @pytest.mark.asyncio
     async def test_rate_limit_exceeded(self, async_client: AsyncClient, mock_db_session):
         """Test that rate limiting works correctly"""
-        mock_db_session.execute.return_value.scalars.return_value.all.return_value = []
-        
+        mock_db_session.execute.return_value = FakeResult()
+
         responses = []
-        for i in range(7): 
+        for i in range(7):
             response = await async_client.get("/v1/")
             responses.append(response)
             print(f"Request {i+1}: Status {response.status_code}")
-        
+
         rate_limited_responses = [r for r in responses if r.status_code == 429]
         assert len(rate_limited_responses) > 0, "Should have received rate limit responses"
-        
+
         for response in rate_limited_responses:
             data = response.json()
             assert "detail" in data
@@ -28,25 +93,24 @@ class TestRateLimiting:
 
     @pytest.mark.asyncio
     async def test_rate_limit_headers(self, async_client: AsyncClient, mock_db_session):
-        """Test that rate limit headers are present"""
-        mock_db_session.execute.return_value.scalars.return_value.all.return_value = []
-        
-        response = await async_client.get("/v1/")
-        
-        headers = response.headers
-        rate_limit_headers = [
-            "X-RateLimit-Limit",
-            "X-RateLimit-Remaining", 
-            "X-RateLimit-Reset",
-            "Retry-After"
-        ]        
-        present_headers = [h for h in rate_limit_headers if h in headers]
+        """Test that rate limit headers are present on rejections"""
+        mock_db_session.execute.return_value = FakeResult()
+
+        responses = []
+        for i in range(7):
+            responses.append(await async_client.get("/v1/"))
 
+        rate_limited = [r for r in responses if r.status_code == 429]
+        assert rate_limited, "Should have hit rate limit"
+        headers = rate_limited[0].headers
+        assert headers.get("X-RateLimit-Limit") is not None
+        assert headers.get("X-RateLimit-Remaining") == "0"
+        assert headers.get("Retry-After") is not None
 
     @pytest.mark.asyncio
     async def test_rate_limit_recovery(self, async_client: AsyncClient, mock_db_session):
         """Test that rate limiting resets after the time window"""
-        mock_db_session.execute.return_value.scalars.return_value.all.return_value = []
+        mock_db_session.execute.return_value = FakeResult()
 
         responses = []
         for i in range(10):
@@ -61,7 +125,7 @@ class TestRateLimiting:
     @pytest.mark.asyncio
     async def test_rate_limit_by_ip(self, async_client: AsyncClient, mock_db_session):
         """Test that rate limiting is applied per IP address"""
-        mock_db_session.execute.return_value.scalars.return_value.all.return_value = []
+        mock_db_session.execute.return_value = FakeResult()
 
         responses = []
         for i in range(7):
@@ -74,8 +138,8 @@ class TestRateLimiting:
     @pytest.mark.asyncio
     async def test_rate_limit_error_response_structure(self, async_client: AsyncClient, mock_db_session):
         """Test the structure of rate limit error responses"""
-        mock_db_session.execute.return_value.scalars.return_value.all.return_value = []
-        
+        mock_db_session.execute.return_value = FakeResult()
+
         responses = []
         for i in range(7):
             response = await async_client.get("/v1/")
@@ -87,19 +151,19 @@ class TestRateLimiting:
                 rate_limited_response = response
                 break
 
-        if rate_limited_response:
-            data = rate_limited_response.json()
-            assert "detail" in data
-            assert "type" in data
-            assert "retry_after" in data
-            assert data["type"] == "RateLimitExceeded"
-            assert "Rate limit exceeded" in data["detail"]
+        assert rate_limited_response is not None, "Should have hit rate limit"
+        data = rate_limited_response.json()
+        assert "detail" in data
+        assert "type" in data
+        assert "retry_after" in data
+        assert data["type"] == "RateLimitExceeded"
+        assert "Rate limit exceeded" in data["detail"]
 
     @pytest.mark.asyncio
     async def test_rate_limit_with_parameters(self, async_client: AsyncClient, mock_db_session):
         """Test rate limiting with query parameters"""
-        mock_db_session.execute.return_value.scalars.return_value.all.return_value = []
-        
+        mock_db_session.execute.return_value = FakeResult()
+
         test_urls = [
             "/v1/search",
             "/v1/search?collectionId=PierSight_V01",
@@ -107,7 +171,7 @@ class TestRateLimiting:
             "/v1/search?bbox=0,0,1,1",
             "/v1/collections/PierSight_V01/items?limit=5"
         ]
-        
+
         responses = []
         for url in test_urls:
             response = await async_client.get(url)
@@ -119,46 +183,83 @@ class TestRateLimiting:
     @pytest.mark.asyncio
     async def test_rate_limit_content_type(self, async_client: AsyncClient, mock_db_session):
         """Test that rate limit responses have correct content type"""
-        mock_db_session.execute.return_value.scalars.return_value.all.return_value = []
+        mock_db_session.execute.return_value = FakeResult()
 
         responses = []
-        for i in range(7): 
-            response = await async_client.get("/v1/")
-            responses.append(response)
-        
-        # Find a rate limited response
-        rate_limited_response = None
-        for response in responses:
-            if response.status_code == 429:
-                rate_limited_response = response
-                break
-        
-        if rate_limited_response:
-            headers = rate_limited_response.headers
-            assert "application/json" in headers.get("content-type", "")
-            
+        for i in range(7):
+            responses.append(await async_client.get("/v1/"))
+
+        rate_limited = [r for r in responses if r.status_code == 429]
+        assert rate_limited, "Should have hit rate limit"
+        assert "application/json" in rate_limited[0].headers.get("content-type", "")
 
     @pytest.mark.asyncio
     async def test_rate_limit_with_caching(self, async_client: AsyncClient, mock_db_session):
         """Test that rate limiting works correctly with caching"""
-        # Mock database response for collections
-        mock_collection = AsyncMock()
-        mock_collection.id = "PierSight_V01"
-        mock_collection.type = "Collection"
-        mock_collection.stac_version = "1.0.0"
-        mock_collection.description = "Test collection"
-        mock_collection.license = "proprietary"
-        mock_collection.title = "Test Collection"
-        mock_collection.extent = {"spatial": {"bbox": [[-180, -90, 180, 90]]}}
-        mock_collection.links = [{"rel": "self", "href": "https://test.com"}]
-        mock_collection.providers = [{"name": "Test Provider"}]
-        
-        mock_db_session.execute.return_value.scalars.return_value.all.return_value = [mock_collection]
-        
+        mock_collection = {
+            "id": "PierSight_V01",
+            "type": "Collection",
+            "stac_version": "1.0.0",
+            "description": "Test collection",
+            "license": "proprietary",
+            "title": "Test Collection",
+            "extent": {"spatial": {"bbox": [[-180, -90, 180, 90]]}},
+            "links": [{"rel": "self", "href": "https://test.com"}],
+            "providers": [{"name": "Test Provider"}],
+        }
+        mock_db_session.execute.return_value = FakeResult([mock_collection])
+
         responses = []
         for i in range(10):
             response = await async_client.get("/v1/collections")
             responses.append(response)
 
         rate_limited_responses = [r for r in responses if r.status_code == 429]
-        assert len(rate_limited_responses) > 0 
\ No newline at end of file
+        assert len(rate_limited_responses) > 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_fallback_without_redis(self):
+        """Test that the per-process fallback enforces the limit when Redis is down"""
+        middleware = RateLimitMiddleware(_ok_app, limit=2)
+        with patch(
+            "middlewares.rate_limit_middleware.redis.from_url",
+            side_effect=ConnectionError("redis down"),
+        ):
+            statuses = [(await _invoke(middleware))[0] for _ in range(4)]
+
+        assert statuses[:2] == [200, 200]
+        assert statuses[2] == 429
+        assert statuses[3] == 429
+
+    @pytest.mark.asyncio
+    async def test_aimd_gate_sheds_load(self):
+        """Test that the concurrency gate rejects with 503 when saturated"""
+        middleware = RateLimitMiddleware(_ok_app, limit=100)
+        middleware._concurrency_limit = 0
+
+        status, sent = await _invoke(middleware)
+
+        assert status == 503
+        import orjson
+        body = orjson.loads(sent[1]["body"])
+        assert body["type"] == "ServerOverloaded"
+
+    def test_aimd_limit_adjusts_on_feedback(self):
+        """Test additive increase on success and multiplicative decrease on 5xx"""
+        middleware = RateLimitMiddleware(_ok_app)
+
+        middleware._observe(500)
+        assert middleware._concurrency_limit == MAX_CONCURRENCY / 2
+
+        middleware._observe(200)
+        assert middleware._concurrency_limit == MAX_CONCURRENCY / 2 + ADDITIVE_INCREASE
+
+        # The limit never collapses below the floor...
+        for _ in range(20):
+            middleware._observe(503)
+        assert middleware._concurrency_limit == MIN_CONCURRENCY
+
+        # ...and never grows past the ceiling.
+        for _ in range(2 * MAX_CONCURRENCY):
+            middleware._observe(200)
+        assert middleware._concurrency_limit == MAX_CONCURRENCY
@@ -1,50 +1,87 @@
 # Imports
 # Standard Library Imports
+import base64
 import json
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 
 # Third-Party Imports
+import orjson
 from fastapi import HTTPException
-from shapely import wkb, wkt, to_geojson
-import pandas as pd
-import geopandas as gpd
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi_cache.coder import Coder
+from shapely import from_wkb
 
 # Local Imports
 from schemas import stac
 
 
-def convert_to_datetime(time_in_str):
+def extract_geometry_coords(geometry_data):
     """
-    Converts a string in ISO 8601 format to a datetime object.
+    Extracts the coordinates from a geometry object.
 
     Parameters:
-        time_in_str: String representing the date and time in the format 'YYYY-MM-DDTHH:MM:SSZ'.
+        geometry_data: The geometry data to extract coordinates from.
 
     Returns:
-        A datetime object if conversion is successful, otherwise None.
+        The coordinates extracted from the geometry.
     """
-    if time_in_str:
-        try:
-            return datetime.strptime(time_in_str, "%Y-%m-%dT%H:%M:%SZ")
-        except ValueError as e:
-            print(str(e))
-    return None
+    if isinstance(geometry_data, list):
+        # Already an exterior-ring coordinate list, e.g. emitted by
+        # ST_AsGeoJSON on the database side.
+        return geometry_data
+    coords = list(geometry_data.exterior.coords)
+    return coords
 
 
-def extract_geometry_coords(geometry_data):
+
+def build_products_batch(records):
     """
-    Extracts the coordinates from a geometry object.
+    Builds STAC product objects for a whole result page in one pass.
+
+    Constructor and method lookups are hoisted out of the loop so each
+    row costs only the dict reads and one model_construct call.
 
     Parameters:
-        geometry_data: The geometry data to extract coordinates from.
+        records: The serialized rows to convert into STAC products.
 
     Returns:
-        The coordinates extracted from the geometry.
+        A list of STAC product objects in row order.
     """
-    coords = list(geometry_data.exterior.coords)
-    return coords
-
+    stac_base = stac.StacBase.model_construct
+    geometry = stac.Geometry.model_construct
+    products = [None] * len(records)
+    for i, stac_obj in enumerate(records):
+        md5_sum = stac_obj["md5_sum"]
+        if isinstance(md5_sum, (bytes, memoryview)):
+            md5_sum = bytes(md5_sum).hex()
+        # Rows come straight from our own tables; skip re-validation.
+        products[i] = stac_base(
+            id=stac_obj["id"],
+            type="Feature",
+            geom_type="Polygon",
+            bounding_box_wkb=geometry(coordinates=extract_geometry_coords(stac_obj["bounding_box_wkb"])),
+            browse=stac_obj["browse"],
+            bytes=stac_obj["bytes"],
+            center_lat=stac_obj["center_lat"],
+            center_lon=stac_obj["center_lon"],
+            product_name=stac_obj["product_name"],
+            product_file=stac_obj["product_file"],
+            orbit_direction=stac_obj["orbit_direction"],
+            md5_sum=md5_sum,
+            orbit_absolute_number=stac_obj["orbit_absolute_number"],
+            processor_version=stac_obj["processor_version"],
+            satellite_name=stac_obj["satellite_name"],
+            polarization=stac_obj["polarization"],
+            processing_time=stac_obj["processing_time"],
+            product_level=stac_obj["product_level"],
+            acquisition_start_utc=stac_obj["acquisition_start_utc"],
+            acquisition_end_utc=stac_obj["acquisition_end_utc"],
+            assets=stac_obj["assets"],
+        )
+    return products
 
 
 def build_products(stac_obj) -> stac.StacBase:
@@ -57,63 +94,93 @@ def build_products(stac_obj) -> stac.StacBase:
     Returns:
         A STAC product object with all relevant fields populated.
     """
-    geom_coords = extract_geometry_coords(stac_obj["bounding_box_wkb"])
-    geom_obj = stac.Geometry(coordinates=geom_coords)
-    return stac.StacBase(
-        id=stac_obj["id"],
-        type="Feature",
-        geom_type="Polygon",
-        bounding_box_wkb=geom_obj,
-        browse=stac_obj["browse"],
-        bytes=stac_obj["bytes"],
-        center_lat=stac_obj["center_lat"],
-        center_lon=stac_obj["center_lon"],
-        product_name=stac_obj["product_name"],
-        product_file=stac_obj["product_file"],
-        orbit_direction=stac_obj["orbit_direction"],
-        md5_sum=stac_obj["md5_sum"],
-        orbit_absolute_number=stac_obj["orbit_absolute_number"],
-        processor_version=stac_obj["processor_version"],
-        satellite_name=stac_obj["satellite_name"],
-        polarization=stac_obj["polarization"],
-        processing_time=stac_obj["processing_time"],
-        product_level=stac_obj["product_level"],
-        acquisition_start_utc=stac_obj["acquisition_start_utc"],
-        acquisition_end_utc=stac_obj["acquisition_end_utc"],
-        assets=stac_obj["assets"],
-    )
-
-
-def serialize_rows(rows, keys):
-    """
-    Serializes a DataFrame of records to a list of dictionaries.
-
-    Converts geometry fields to GeoJSON and replaces any NaN values with None.
+    return build_products_batch((stac_obj,))[0]
+
+
+def serialize_rows(result):
+    """
+    Finalizes mapping records into response-ready dictionaries.
+
+    Rows arrive as dicts built from Result.mappings(), so no per-row
+    key zipping happens in Python; this only decodes the geometry
+    column, vectorized across the whole page where shapely is involved.
 
     Parameters:
-        dataframe: The DataFrame containing the records to serialize.
+        result: The list of record dictionaries from the query.
 
     Returns:
         A list of dictionaries representing the serialized records.
     """
-    df = pd.DataFrame(rows, columns=keys)
-    gdf = gpd.GeoDataFrame(df,geometry=gpd.GeoSeries.from_wkb(df['bounding_box_wkb'], crs="EPSG:4326"))
-    gdf = gdf.drop(columns=['bounding_box_wkb'])
-    gdf = gdf.rename(columns={'geometry': 'bounding_box_wkb'})
-    result = gdf.to_dict(orient='records')
-    df = pd.DataFrame(rows, columns=keys)
-    gdf = gpd.GeoDataFrame(df,geometry=gpd.GeoSeries.from_wkb(df['bounding_box_wkb'], crs="EPSG:4326"))
-    gdf = gdf.drop(columns=['bounding_box_wkb'])
-    gdf = gdf.rename(columns={'geometry': 'bounding_box_wkb'})
-    result = gdf.to_dict(orient='records')
-
-    for res in result:
-        for key, value in res.items():
-            import math
-            if isinstance(value, float) and math.isnan(value):
-                res[key] = None
+    if not result:
+        return result
+    if 'bbox_geojson' in result[0]:
+        # PostGIS already serialized the geometry; lift the exterior
+        # ring straight out of the GeoJSON text without touching GEOS.
+        for record in result:
+            record['bounding_box_wkb'] = orjson.loads(record.pop('bbox_geojson'))['coordinates'][0]
+    elif 'bounding_box_wkb' in result[0]:
+        geoms = from_wkb([record['bounding_box_wkb'] for record in result])
+        for record, geom in zip(result, geoms):
+            record['bounding_box_wkb'] = geom
     return result
-        
+
+
+@lru_cache(maxsize=1024)
+def parse_bbox(bbox):
+    """
+    Parses a comma-separated bbox string into a tuple of floats.
+
+    Memoized on the raw string because clients tend to repeat the same
+    areas of interest, so the split/float work runs once per AOI.
+
+    Parameters:
+        bbox: The comma-separated bbox string from the query.
+
+    Returns:
+        A tuple of floats in the order given.
+
+    Raises:
+        ValueError: If any element is not a number.
+    """
+    return tuple(float(x) for x in bbox.split(","))
+
+
+def encode_cursor(acquisition_start_utc, item_id):
+    """
+    Encodes a keyset-pagination cursor for the next page link.
+
+    Parameters:
+        acquisition_start_utc: The last row's acquisition start time.
+        item_id: The last row's id.
+
+    Returns:
+        An opaque URL-safe cursor string.
+    """
+    raw = f"{acquisition_start_utc}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Decodes a keyset-pagination cursor back into its key columns.
+
+    Parameters:
+        cursor: The opaque cursor string from the request.
+
+    Returns:
+        A (acquisition_start_utc, item_id) tuple.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, _, item_id = raw.partition("|")
+        return datetime.fromisoformat(timestamp), item_id
+    except Exception:
+        raise HTTPException(status_code=422, detail="Invalid cursor.")
+
+
 def validate_bbox(bbox: Optional[str]):
     """
     Validates that the provided coordinates are in a valid WKT format.
@@ -133,49 +200,84 @@ def validate_bbox(bbox: Optional[str]):
             raise HTTPException(status_code=422, detail="bbox coordinates are invalid.")
     
                     
-def validate_time(time: Optional[str], field_name):
+def parse_time_range(start_time: Optional[str], stop_time: Optional[str]):
     """
-    Validates that the provided time string is in ISO 8601 format.
+    Validates and converts the optional time filters in one pass.
+
+    Each timestamp is parsed exactly once instead of the previous
+    validate-then-convert double parse, and the range ordering is
+    checked on the parsed values.
 
     Parameters:
-        time: The time string to validate.
-        field_name: The name of the field being validated (for error messages).
+        start_time: The start time string to parse, if provided.
+        stop_time: The stop time string to parse, if provided.
+
+    Returns:
+        A (start, stop) tuple of datetimes, None where not provided.
 
     Raises:
-        HTTPException: If the time string is not in ISO 8601 format.
+        HTTPException: If a timestamp is malformed or the range is
+        inverted.
     """
-    if time is not None:
+    parsed = []
+    for value, field_name in ((start_time, "start_time"), (stop_time, "stop_time")):
+        if value is None:
+            parsed.append(None)
+            continue
         try:
-            if time.endswith('Z'):
-                time=time[:-1]
-            datetime.fromisoformat(time)
+            parsed.append(datetime.fromisoformat(value[:-1] if value.endswith('Z') else value))
         except Exception:
             raise HTTPException(status_code=422, detail=f"Invalid {field_name}; Must be in ISO 8601 datetime.")
-        
+    start, stop = parsed
+    if start and stop and start > stop:
+        raise HTTPException(status_code=400, detail=f"acquisition_start_utc: {start_time} is exceeding acquisition_end_utc: {stop_time}")
+    return start, stop
+
 
-def validate_inputs(bbox, start_time, stop_time):
+class ORJsonCoder(Coder):
     """
-    Validates the input parameters for bbox and time filters.
+    Cache coder that serializes values with orjson.
 
-    Parameters:
-        coordinates: The geometry coordinates to validate.
-        start_time: The start time string to validate.
-        stop_time: The stop time string to validate.
+    Encodes pydantic models and datetimes through jsonable_encoder and
+    keeps the decode side a plain orjson.loads, which is considerably
+    faster than the default stdlib JSON coder for the large search
+    payloads this API caches.
+    """
+
+    @classmethod
+    def encode(cls, value):
+        # Handlers may return a prebuilt JSONResponse; cache its body,
+        # not the Response object, so hits decode back to the payload
+        # (mirrors the stock JsonCoder special case).
+        if isinstance(value, JSONResponse):
+            return value.body
+        return orjson.dumps(value, default=jsonable_encoder)
+
+    @classmethod
+    def decode(cls, value):
+        return orjson.loads(value)
 
-    Raises:
-        HTTPException: If any input is invalid.
-    """
-    if bbox:
-        validate_bbox(bbox)
-    if start_time:
-        validate_time(start_time, field_name="start_time")
-    if stop_time:
-        validate_time(stop_time, field_name="stop_time")
-    
 
 def my_key_builder(func, namespace, request=None, response=None, args=(), kwargs=None):
-    key = f"{namespace}:{request.url.path}"
-    if request:
-        params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.items()))
-        key += f"?{params}"
-    return key
\ No newline at end of file
+    """
+    Builds a deterministic cache key from the path and query parameters.
+
+    Stays on plain string formatting — no JSON serialization or digest —
+    so key construction is cheap even on cache hits. Query parameters
+    are sorted so equivalent requests share one cache entry.
+
+    Parameters:
+        func: The cached endpoint function.
+        namespace: The cache namespace configured on the decorator.
+        request: The incoming HTTP request, if available.
+        response: The outgoing HTTP response, if available.
+        args: Positional arguments of the endpoint call.
+        kwargs: Keyword arguments of the endpoint call.
+
+    Returns:
+        The cache key string for this request.
+    """
+    if request is None:
+        return f"{namespace}:{func.__module__}.{func.__name__}"
+    query = "&".join([f"{k}={v}" for k, v in sorted(request.query_params.multi_items())])
+    return f"{namespace}:{request.url.path}?{query}"
\ No newline at end of file
@@ -3,9 +3,8 @@
 from datetime import datetime
 
 # Third-Party Imports
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import CheckConstraint, Column, Integer, String, DateTime
 from database import Base
-from sqlalchemy_utils import EmailType
 
 
 ############################################################################################################
@@ -30,9 +29,12 @@ class User(Base):
         None
     """
     __tablename__ = 'user'
-    __table_args__ = {'schema': 'piersight_stac'}
-    
+    __table_args__ = (
+        CheckConstraint("email ~* '^[^@]+@[^@]+\\.[^@]+$'", name='ck_user_email_format'),
+        {'schema': 'piersight_stac'},
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    email = Column(EmailType, nullable=False, index=True, unique=True)
+    email = Column(String(254), nullable=False, index=True, unique=True)
     password = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.now())
\ No newline at end of file